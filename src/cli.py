@@ -3,18 +3,19 @@ Module: cli
 Purpose: Command-line interface entry point.
 """
 
+from __future__ import annotations
+
 import argparse
-import io
 import json
 import os
-import shlex
 import sys
 from collections import Counter
-from typing import Callable, List, Sequence, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, List, Sequence, Tuple
 
-from . import duplicates, hashing, metadata, merge_engine, organizer, reporting, scanner
-from .review import describe_review_reason
-from .cli_formatter import CLIFormatter, detect_terminal_capabilities
 from .exceptions import (
     NolossiaError,
     MergeExecutionError,
@@ -23,15 +24,6 @@ from .exceptions import (
     UndoInputError,
     UndoSafetyError,
 )
-from .models.cluster import DuplicateCluster
-from .models.fileinfo import FileInfo
-from .models.mergeplan import MergePlan
-from .models.actions import (
-    MergeAction,
-    MoveMasterAction,
-    MarkNearDuplicateAction,
-    MoveToQuarantineExactAction,
-)
 from .utils import (
     DEFAULT_PIXEL_LIMIT,
     MAX_OVERRIDE_LIMIT,
@@ -41,26 +33,65 @@ from .utils import (
     EXECUTOR_ENV,
     current_pixel_limit,
     human_readable_size,
+    io_workers,
 )
 
+if TYPE_CHECKING:  # Pipeline modules are imported lazily to keep --help fast
+    from .cli_formatter import CLIFormatter
+    from .models.actions import MergeAction
+    from .models.cluster import DuplicateCluster
+    from .models.fileinfo import FileInfo
+    from .models.mergeplan import MergePlan
+
 MAX_PHASE_LINES = 35
+_DIAGNOSTICS_BATCH_SIZE = 256
+# Status block glyphs keyed by status; None is the fallback for unknown statuses.
+_STATUS_GLYPHS_UNICODE = {"ok": "✓", "warn": "!", "error": "✖", None: "•"}
+_STATUS_GLYPHS_ASCII = {"ok": "SUCCESS", "warn": "WARN", "error": "ERROR", None: "INFO"}
+_STORAGE_BREAKDOWN_KEYS = ("masters", "quarantine", "review")
+# Pipe summary phases and statuses. Scan and dedupe summaries reuse the phase as their
+# status; _emit_pipe_summary upper-cases the status on output.
+_PIPE_PHASE_SCAN = "scan"
+_PIPE_PHASE_DEDUPE = "dedupe"
+_PIPE_PHASE_MERGE = "merge"
+_PIPE_STATUS_SCAN_FAST = "scan_fast"
+_PIPE_STATUS_DRY_RUN = "dry_run"
+_PIPE_STATUS_EXECUTED = "executed"
 
 _RUN_LOG_PATH: str | None = None
-_DEFAULT_ARTIFACTS = [
-    reporting.artifact_path("merge_plan.json"),
-    reporting.artifact_path("dedupe_report.html"),
-    reporting.artifact_path("merge_report.html"),
-]
-_UNDO_ARTIFACTS = [
-    reporting.artifact_path("undo_report.html"),
-    reporting.artifact_path("undo_manifest.json"),
-]
+_DEFAULT_ARTIFACT_NAMES = ("merge_plan.json", "dedupe_report.html", "merge_report.html")
+_UNDO_ARTIFACT_NAMES = ("undo_report.html", "undo_manifest.json")
+_MERGE_REPORT_NAMES = _DEFAULT_ARTIFACT_NAMES + (
+    "source_manifest.json",
+    "source_manifest.csv",
+    "source_manifest.html",
+)
+
+
+def _default_artifacts() -> list[str]:
+    """
+    Return artifact paths surfaced in failure summaries for scan/merge commands.
+    """
+    from . import reporting
+
+    return [reporting.artifact_path(name) for name in _DEFAULT_ARTIFACT_NAMES]
+
+
+def _undo_artifacts() -> list[str]:
+    """
+    Return artifact paths surfaced in failure summaries for undo.
+    """
+    from . import reporting
+
+    return [reporting.artifact_path(name) for name in _UNDO_ARTIFACT_NAMES]
 
 
 def _ensure_run_log_path() -> str:
     """
     Guarantee nolossia.log exists and return its absolute path.
     """
+    from . import reporting
+
     global _RUN_LOG_PATH
     if _RUN_LOG_PATH:
         return _RUN_LOG_PATH
@@ -72,6 +103,8 @@ def _current_log_path() -> str:
     """
     Return the best-known log path (absolute) without reinitializing the log.
     """
+    from . import reporting
+
     if _RUN_LOG_PATH:
         return _RUN_LOG_PATH
     return os.path.abspath(reporting.LOG_FILE_NAME)
@@ -81,10 +114,11 @@ def _render_step_header(formatter: CLIFormatter, step: int, total: int, title: s
     """
     Print a standardized step header per DESIGN-TUI contract.
     """
-    if formatter.config.pipe_mode:
+    cfg = formatter.config
+    if cfg.pipe_mode:
         return
     header = f"STEP {step}/{total} — {title}"
-    if formatter.config.plain_mode or not formatter.config.unicode_enabled:
+    if cfg.plain_mode or not cfg.unicode_enabled:
         header = header.upper()
     formatter.blank()
     formatter.line(formatter.label(header, level="info"))
@@ -109,46 +143,58 @@ def _render_status_block(formatter: CLIFormatter, entries: list[tuple[str, str,
     Render compact action status list; entries = (status, label, detail).
     status: "ok" | "warn" | "error"
     """
-    if formatter.config.pipe_mode:
+    cfg = formatter.config
+    if cfg.pipe_mode:
         return
-    icon_map = {
-        "ok": ("✓", "success"),
-        "warn": ("!", "warn"),
-        "error": ("✖", "error"),
-    }
+    glyphs = _STATUS_GLYPHS_UNICODE if cfg.unicode_enabled else _STATUS_GLYPHS_ASCII
+    lines: list[str] = []
     for status, label, detail in entries:
-        icon, level = icon_map.get(status, ("•", "info"))
-        glyph = icon if formatter.config.unicode_enabled else level.upper()
-        formatter.line(f"{glyph} {label}")
+        glyph = glyphs.get(status, glyphs[None])
+        lines.append(f"{glyph} {label}")
         if detail:
-            formatter.muted(f"   {detail}")
+            lines.append(formatter.style(f"   {detail}", formatter.palette["muted"]))
+    formatter.list_lines(lines)
+
+
+@lru_cache(maxsize=16)
+def _box_chrome(width: int, unicode: bool) -> tuple[str, str, str, str, str]:
+    """
+    Return (top, bottom, blank_row, vert, row_template) strings for a summary box.
+    """
+    tl, tr, bl, br, horiz, vert = ("┌", "┐", "└", "┘", "─", "│") if unicode else ("+", "+", "+", "+", "-", "|")
+    return (
+        f"{tl}{horiz * (width - 2)}{tr}",
+        f"{bl}{horiz * (width - 2)}{br}",
+        f"{vert}{' ' * (width - 2)}{vert}",
+        vert,
+        f"{vert} {{:<{width - 3}}}{vert}",
+    )
 
 
 def _render_summary_box(formatter: CLIFormatter, rows: list[tuple[str, str]], *, title: str = "SUMMARY") -> None:
     """
     Render SUMMARY box with deterministic width.
     """
-    if formatter.config.pipe_mode:
+    cfg = formatter.config
+    if cfg.pipe_mode:
         return
     width = min(formatter.line_width, 96)
-    unicode = formatter.config.unicode_enabled and not formatter.config.plain_mode
-    tl, tr, bl, br, horiz, vert = ("┌", "┐", "└", "┘", "─", "│") if unicode else ("+", "+", "+", "+", "-", "|")
-    box_title = f" {title} "
-    top = f"{tl}{horiz * (width - 2)}{tr}"
-    title_line = f"{vert}{box_title.center(width - 2)}{vert}"
-    formatter.line(top)
-    formatter.line(title_line)
-    formatter.line(f"{vert}{' ' * (width - 2)}{vert}")
+    unicode = cfg.unicode_enabled and not cfg.plain_mode
+    top, bottom, blank_row, vert, row_template = _box_chrome(width, unicode)
+    lines = [top, f"{vert}{f' {title} '.center(width - 2)}{vert}", blank_row]
     for label, value in rows:
         text = f"{label:<24} {value}"
         if len(text) > width - 4:
             text = text[: width - 7] + "..."
-        formatter.line(f"{vert} {text.ljust(width - 3)}{vert}")
-    formatter.line(f"{vert}{' ' * (width - 2)}{vert}")
-    formatter.line(f"{bl}{horiz * (width - 2)}{br}")
+        lines.append(row_template.format(text))
+    lines.append(blank_row)
+    lines.append(bottom)
+    formatter.list_lines(lines)
 
 
 def _render_undo_summary(formatter: CLIFormatter, summary: dict) -> None:
+    from . import reporting
+
     if formatter.config.pipe_mode:
         return
     counts = summary.get("counts", {})
@@ -181,20 +227,22 @@ def _render_reports_block(
     *,
     max_items: int = 3,
 ) -> None:
-    if formatter.config.pipe_mode or not reports:
+    cfg = formatter.config
+    if cfg.pipe_mode or not reports:
         return
-    bullet = "•" if formatter.config.unicode_enabled and not formatter.config.plain_mode else "*"
-    formatter.line("Reports:")
+    bullet = "•" if cfg.unicode_enabled and not cfg.plain_mode else "*"
+    lines = ["Reports:"]
     visible = reports[:max_items]
     for path, label in visible:
         display = formatter.link(path, label)
         open_cmd = _report_open_command(path)
-        formatter.line(f"  {bullet} FILE: {display}")
-        formatter.line(f"    PATH: {path}")
-        formatter.line(f"    OPEN: {open_cmd}")
+        lines.append(f"  {bullet} FILE: {display}")
+        lines.append(f"    PATH: {path}")
+        lines.append(f"    OPEN: {open_cmd}")
     remaining = len(reports) - len(visible)
     if remaining > 0:
-        formatter.line(f"  {bullet} +{remaining} more (full list: merge_report.html)")
+        lines.append(f"  {bullet} +{remaining} more (full list: merge_report.html)")
+    formatter.list_lines(lines)
 
 
 def _render_warnings_frame(formatter: CLIFormatter, warnings: list[str]) -> None:
@@ -212,6 +260,8 @@ def _render_next_steps(formatter: CLIFormatter, steps: list[str]) -> None:
 
 
 def _undo_flow(operation_id: str, preview: bool, formatter: CLIFormatter) -> int:
+    from . import merge_engine, reporting
+
     manifest_path = reporting.artifact_path("source_manifest.json")
     try:
         plan = merge_engine.prepare_undo_plan(manifest_path, operation_id)
@@ -226,7 +276,7 @@ def _undo_flow(operation_id: str, preview: bool, formatter: CLIFormatter) -> int
                 "Run a merge with --execute to generate a source manifest.",
                 "Verify the operation_id matches the manifest batch_id.",
             ],
-            artifacts=_UNDO_ARTIFACTS,
+            artifacts=_undo_artifacts(),
         )
         return 1
 
@@ -237,9 +287,10 @@ def _undo_flow(operation_id: str, preview: bool, formatter: CLIFormatter) -> int
         summary = merge_engine.preview_undo(plan)
         reporting.write_undo_manifest(summary, undo_manifest)
         reporting.write_undo_report(summary, undo_report)
-        _render_mode_label(formatter, "PREVIEW")
-        _render_undo_summary(formatter, summary)
-        formatter.success("Undo preview complete.")
+        if not formatter.config.pipe_mode:
+            _render_mode_label(formatter, "PREVIEW")
+            _render_undo_summary(formatter, summary)
+            formatter.success("Undo preview complete.")
         return 0
 
     confirm = _prompt(formatter, "Type 'UNDO' to move files back now (Enter cancels): ")
@@ -251,7 +302,7 @@ def _undo_flow(operation_id: str, preview: bool, formatter: CLIFormatter) -> int
             reason="User cancelled undo.",
             last_step="Undo confirmation",
             remediation=["Re-run with UNDO to proceed."],
-            artifacts=_UNDO_ARTIFACTS,
+            artifacts=_undo_artifacts(),
         )
         return 0
 
@@ -272,7 +323,7 @@ def _undo_flow(operation_id: str, preview: bool, formatter: CLIFormatter) -> int
                 "Review undo_report.html for the impacted files.",
                 "Resolve conflicts or integrity issues, then retry undo.",
             ],
-            artifacts=_UNDO_ARTIFACTS,
+            artifacts=_undo_artifacts(),
         )
         return 2
     except Exception as exc:
@@ -286,15 +337,16 @@ def _undo_flow(operation_id: str, preview: bool, formatter: CLIFormatter) -> int
                 "Review nolossia.log for details.",
                 "Resolve the issue and retry undo.",
             ],
-            artifacts=_UNDO_ARTIFACTS,
+            artifacts=_undo_artifacts(),
         )
         return 1
 
     reporting.write_undo_manifest(summary, undo_manifest)
     reporting.write_undo_report(summary, undo_report)
-    _render_mode_label(formatter, "EXECUTE")
-    _render_undo_summary(formatter, summary)
-    formatter.success("Undo execution complete.")
+    if not formatter.config.pipe_mode:
+        _render_mode_label(formatter, "EXECUTE")
+        _render_undo_summary(formatter, summary)
+        formatter.success("Undo execution complete.")
     return 0
 
 
@@ -305,7 +357,10 @@ def _render_settings_tiers(
     source_paths: list[str],
     destination_path: str | None,
 ) -> None:
-    if formatter.config.pipe_mode:
+    from . import reporting
+
+    cfg = formatter.config
+    if cfg.pipe_mode:
         return
     def normalize_sensitivity(value: str) -> str:
         normalized = value.strip().lower()
@@ -325,9 +380,9 @@ def _render_settings_tiers(
     formatter.kv("Destination", destination_path or "Prompted during setup")
     formatter.kv("Output", "Reports in artifacts/ (dedupe_report.html, merge_report.html, merge_plan.json)")
     formatter.kv("Speed", "Normal (hash + dedupe)")
-    formatter.kv("Theme", formatter.config.theme)
-    formatter.kv("Plain output", "on" if formatter.config.plain_mode else "off")
-    formatter.kv("ASCII output", "on" if not formatter.config.unicode_enabled else "off")
+    formatter.kv("Theme", cfg.theme)
+    formatter.kv("Plain output", "on" if cfg.plain_mode else "off")
+    formatter.kv("ASCII output", "on" if not cfg.unicode_enabled else "off")
 
     advanced = _prompt(formatter, "Advanced settings? [y/N] ", default="").lower()
     if advanced != "y":
@@ -339,8 +394,8 @@ def _render_settings_tiers(
     )
     sensitivity_choice = _prompt(formatter, sensitivity_prompt, default="").strip()
     if sensitivity_choice:
-        formatter.config.look_alike_sensitivity = normalize_sensitivity(sensitivity_choice)
-    if formatter.config.look_alike_sensitivity == "aggressive":
+        cfg.look_alike_sensitivity = normalize_sensitivity(sensitivity_choice)
+    if cfg.look_alike_sensitivity == "aggressive":
         confirm = _prompt(
             formatter,
             "Type 'AGGRESSIVE' to confirm higher-risk matching (Enter cancels): ",
@@ -348,28 +403,29 @@ def _render_settings_tiers(
         ).strip()
         if confirm != "AGGRESSIVE":
             formatter.warning("Aggressive sensitivity not confirmed; using Conservative.")
-            formatter.config.look_alike_sensitivity = "conservative"
-    sensitivity_label = formatter.config.look_alike_sensitivity.title()
-    if formatter.config.look_alike_sensitivity == "conservative":
+            cfg.look_alike_sensitivity = "conservative"
+    sensitivity_label = cfg.look_alike_sensitivity.title()
+    if cfg.look_alike_sensitivity == "conservative":
         sensitivity_label = f"{sensitivity_label} (default)"
     formatter.kv("Look-alike sensitivity", sensitivity_label)
-    pixel_source = formatter.config.pixel_limit_source
-    if pixel_source != "default" and formatter.config.pixel_limit:
+    pixel_source = cfg.pixel_limit_source
+    if pixel_source != "default" and cfg.pixel_limit:
         source_label = "CLI flag" if pixel_source == "cli" else f"${PIXEL_LIMIT_ENV}"
-        pixel_label = f"{formatter.config.pixel_limit:,} via {source_label}"
+        pixel_label = f"{cfg.pixel_limit:,} via {source_label}"
     else:
         pixel_label = f"off (default {DEFAULT_PIXEL_LIMIT:,})"
     formatter.kv("Pixel limit override", pixel_label)
-    formatter.kv("Pipe output format", formatter.config.pipe_format)
+    formatter.kv("Pipe output format", cfg.pipe_format)
     formatter.kv("Report verbosity", "full (default)")
-    formatter.kv("Diagnostics logging", "on" if formatter.config.verbose else "off")
-    reporting.write_log([f"[INFO] Look-alike sensitivity set to {formatter.config.look_alike_sensitivity}"])
+    formatter.kv("Diagnostics logging", "on" if cfg.verbose else "off")
+    reporting.write_log([f"[INFO] Look-alike sensitivity set to {cfg.look_alike_sensitivity}"])
 
 
 def _render_sensitivity_banner(formatter: CLIFormatter) -> None:
-    if formatter.config.pipe_mode:
+    cfg = formatter.config
+    if cfg.pipe_mode:
         return
-    sensitivity = formatter.config.look_alike_sensitivity
+    sensitivity = cfg.look_alike_sensitivity
     if sensitivity == "balanced":
         formatter.line("Look-alike sensitivity: Balanced")
     elif sensitivity == "aggressive":
@@ -392,7 +448,8 @@ def _render_glossary(formatter: CLIFormatter) -> None:
     """
     Render a short glossary for core terms in wizard output.
     """
-    if formatter.config.pipe_mode or not formatter.config.show_glossary:
+    cfg = formatter.config
+    if cfg.pipe_mode or not cfg.show_glossary:
         return
     formatter.section("Glossary", icon="◇")
     formatter.bullet("Dedupe: read-only duplicate detection and clustering.", indent="  - ")
@@ -413,6 +470,24 @@ def _render_glossary(formatter: CLIFormatter) -> None:
     formatter.bullet("Set aside for review: files missing reliable dates or needing manual review.", indent="  - ")
 
 
+def _total_size(items: Sequence[FileInfo | MergeAction]) -> int:
+    """
+    Sum file or action sizes with a C-level map/attrgetter reduction, treating a missing size as 0.
+    """
+    return sum(filter(None, map(attrgetter("size"), items)))
+
+
+def _split_paths(text: str) -> list[str]:
+    """
+    Split a space-separated path list; quoted or escaped input goes through shlex.
+    """
+    if "'" not in text and '"' not in text and "\\" not in text:
+        return text.split()
+    import shlex
+
+    return shlex.split(text)
+
+
 def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int | None:
     if formatter.config.pipe_mode:
         _render_failure_summary(
@@ -462,7 +537,7 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
             "→ Source paths (space-separated): ",
             default="",
         )
-        paths = shlex.split(paths_input)
+        paths = _split_paths(paths_input)
         if not paths:
             formatter.warning("No source paths provided.")
             continue
@@ -472,7 +547,7 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
             return None
 
         if choice == "dedupe":
-            hashed, clusters, skipped, skipped_symlinks = _scan_and_group(paths, formatter=formatter)
+            hashed, clusters, skipped, skipped_symlinks, total_size = _scan_and_group(paths, formatter=formatter)
             unique_size = _estimate_unique_size(hashed, clusters)
             proceed, stats = _dedupe_flow(
                 paths,
@@ -485,7 +560,7 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
             if proceed:
                 scan_summary = {
                     "supported": len(hashed),
-                    "size": sum((f.size or 0) for f in hashed),
+                    "size": total_size,
                     "skipped": skipped,
                     "skipped_symlinks": skipped_symlinks,
                 }
@@ -511,10 +586,10 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
                     destination_path=None,
                 )
                 _render_sensitivity_banner(formatter)
-            hashed, clusters, skipped, skipped_symlinks = _scan_and_group(paths, formatter=formatter)
+            hashed, clusters, skipped, skipped_symlinks, total_size = _scan_and_group(paths, formatter=formatter)
             scan_summary = {
                 "supported": len(hashed),
-                "size": sum((f.size or 0) for f in hashed),
+                "size": total_size,
                 "skipped": skipped,
                 "skipped_symlinks": skipped_symlinks,
             }
@@ -523,8 +598,8 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
             if formatter.config.pipe_mode and formatter.config.stream_json:
                 _emit_pipe_summary(
                     formatter,
-                    status="scan",
-                    phase="scan",
+                    status=_PIPE_PHASE_SCAN,
+                    phase=_PIPE_PHASE_SCAN,
                     masters=scan_summary["supported"],
                     duplicates=0,
                     near=0,
@@ -538,8 +613,8 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
                 )
                 _emit_pipe_summary(
                     formatter,
-                    status="dedupe",
-                    phase="dedupe",
+                    status=_PIPE_PHASE_DEDUPE,
+                    phase=_PIPE_PHASE_DEDUPE,
                     masters=stats["masters"],
                     duplicates=stats["exact_redundant"],
                     near=stats["near_redundant"],
@@ -567,6 +642,24 @@ def _start_flow(formatter: CLIFormatter, *, show_glossary: bool = True) -> int |
     return None
 
 
+@lru_cache(maxsize=1)
+def _compact_json_encoder() -> Callable[[object], str]:
+    """
+    Return the compact JSON encoder for pipe output, using orjson when it is installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return lambda payload: json.dumps(payload, separators=(",", ":"))
+
+    def encode(payload: object) -> str:
+        line = orjson.dumps(payload).decode("utf-8")
+        # orjson emits raw UTF-8; fall back so non-ASCII keeps json's \u escapes.
+        return line if line.isascii() else json.dumps(payload, separators=(",", ":"))
+
+    return encode
+
+
 def _emit_pipe_summary(
     formatter: CLIFormatter,
     *,
@@ -587,26 +680,25 @@ def _emit_pipe_summary(
         return
     pipe_format = getattr(formatter.config, "pipe_format", "json")
     storage_breakdown = storage_breakdown or {}
-    report_counts: dict[str, int] = {}
-    for report in reports:
-        name = os.path.basename(report) if report else ""
-        if not name:
-            continue
-        report_counts[name] = report_counts.get(name, 0) + 1
+    report_counts = Counter(name for name in map(os.path.basename, reports) if name)
     if pipe_format == "kv":
-        reports_value = ",".join(reports) if reports else "-"
-        samples_value = ",".join(review_samples or []) or "-"
         breakdown_value = ",".join(
-            f"{key}:{storage_breakdown.get(key, '-')}"
-            for key in ("masters", "quarantine", "review")
+            f"{key}:{storage_breakdown.get(key, '-')}" for key in _STORAGE_BREAKDOWN_KEYS
         )
-        reports_summary = ",".join(f"{key}:{value}" for key, value in report_counts.items()) or "-"
-        line = (
-            f"status={status.upper()} phase={phase} totals=masters:{masters},dups:{duplicates},near:{near} "
-            f"storage=required:{required},available:{available} storage_breakdown={breakdown_value} "
-            f"review={review} review_samples={samples_value} skipped={skipped} reports={reports_value} "
-            f"reports_count={len(report_counts)} reports_summary={reports_summary}"
+        fields = (
+            ("status", status.upper()),
+            ("phase", phase),
+            ("totals", f"masters:{masters},dups:{duplicates},near:{near}"),
+            ("storage", f"required:{required},available:{available}"),
+            ("storage_breakdown", breakdown_value),
+            ("review", review),
+            ("review_samples", ",".join(review_samples or []) or "-"),
+            ("skipped", skipped),
+            ("reports", ",".join(reports) if reports else "-"),
+            ("reports_count", len(report_counts)),
+            ("reports_summary", ",".join(f"{key}:{value}" for key, value in report_counts.items()) or "-"),
         )
+        line = " ".join(f"{key}={value}" for key, value in fields)
     else:
         payload = {
             "schema_version": "1.0",
@@ -626,7 +718,7 @@ def _emit_pipe_summary(
             "reports_count": len(report_counts),
             "reports_summary": report_counts,
         }
-        line = json.dumps(payload, separators=(",", ":"))
+        line = _compact_json_encoder()(payload)
     target = getattr(formatter, "pipe_target", sys.stdout)
     target.write(line + "\n")
 
@@ -634,31 +726,37 @@ def _emit_pipe_summary(
 def _render_chronology_table(formatter: CLIFormatter, rows: list[tuple[str, int, str]]) -> None:
     if formatter.config.pipe_mode or not rows:
         return
-    formatter.blank()
-    formatter.line(formatter.label("Top chronology (Year-Month)", level="info"))
     header = "Year Month Count Percent"
-    formatter.line(header)
-    formatter.line("-" * len(header))
+    lines = ["", formatter.label("Top chronology (Year-Month)", level="info"), header, "-" * len(header)]
     for label, count, percent in rows:
-        year, month = label.split("-", 1) if "-" in label else (label, "")
-        formatter.line(f"{year:<5} {month:<5} {count:<6} {percent}")
+        year, _, month = label.partition("-")
+        lines.append(f"{year:<5} {month:<5} {count:<6} {percent}")
+    formatter.list_lines(lines)
 
 
 def _is_exact_cluster(cluster) -> bool:
     """
     Determine if all files in cluster share the same non-empty SHA256.
     """
-    sha_values = {f.sha256 for f in cluster.files if f.sha256 is not None}
-    return len(sha_values) == 1 and all(f.sha256 is not None for f in cluster.files)
+    files = cluster.files
+    if not files:
+        return False
+    first = files[0].sha256
+    return first is not None and all(f.sha256 == first for f in files)
 
 
 def _scan_and_group(
     paths: List[str],
     formatter: CLIFormatter | None = None,
-) -> tuple[List[FileInfo], List[DuplicateCluster], int, int]:
+) -> tuple[List[FileInfo], List[DuplicateCluster], int, int, int]:
     """
     Helper to scan paths, enrich metadata, hash, and group duplicates.
+
+    Returns the hashed files, clusters, skipped and symlink counts, and the total
+    size of the hashed files.
     """
+    from . import duplicates, hashing, metadata, reporting, scanner
+
     fileinfos, skipped_symlinks = scanner.scan_paths_with_stats(paths)
     enriched = metadata.enrich_metadata(fileinfos)
     metadata_skipped = len(fileinfos) - len(enriched)
@@ -667,27 +765,33 @@ def _scan_and_group(
     skipped_total = metadata_skipped + hashing_skipped
     reporter: Callable[[str], None] | None = None
     diagnostics_logger: Callable[[dict], None] | None = None
+    diagnostics_batch: List[str] = []
     if formatter and formatter.config.verbose:
         def reporter(message: str) -> None:
             formatter.verbose(f"[duplicates] {message}")
         def diagnostics_logger(payload: dict) -> None:
-            reporting.write_log(
-                [f"[VERBOSE][NEAR_DUP] {json.dumps(payload, sort_keys=True)}"]
-            )
+            diagnostics_batch.append(f"[VERBOSE][NEAR_DUP] {json.dumps(payload, sort_keys=True)}")
+            if len(diagnostics_batch) >= _DIAGNOSTICS_BATCH_SIZE:
+                reporting.write_log(diagnostics_batch)
+                diagnostics_batch.clear()
     sensitivity = formatter.config.look_alike_sensitivity if formatter else "conservative"
-    clusters = duplicates.group_duplicates(
-        hashed,
-        reporter=reporter,
-        diagnostics_logger=diagnostics_logger,
-        sensitivity=sensitivity,
-    )
+    try:
+        clusters = duplicates.group_duplicates(
+            hashed,
+            reporter=reporter,
+            diagnostics_logger=diagnostics_logger,
+            sensitivity=sensitivity,
+        )
+    finally:
+        if diagnostics_batch:
+            reporting.write_log(diagnostics_batch)
     if formatter and skipped_total:
         formatter.warning(
             "Skipped "
             f"{skipped_total} files after hitting the {current_pixel_limit():,} pixel limit "
             f"or encountering unreadable data. See {reporting.LOG_FILE_NAME} for per-file details."
         )
-    return hashed, clusters, skipped_total, skipped_symlinks
+    return hashed, clusters, skipped_total, skipped_symlinks, _total_size(hashed)
 
 
 def _pixel_limit_arg(value: str) -> int:
@@ -702,33 +806,100 @@ def _pixel_limit_arg(value: str) -> int:
     return parsed
 
 
-def _collect_files(paths: List[str]) -> tuple[List[str], int]:
+def _entry_size(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+
+def _list_directory(root: str) -> tuple[List[tuple[str, int, bool]], List[str], int] | None:
     """
-    Collect all files under provided paths for summary purposes.
+    Read one directory and return ((path, size, supported) files, subdirectories, symlink count).
+    Only supported files are statted; others report size 0. Returns None when unreadable.
     """
-    all_files: List[str] = []
-    skipped_symlinks = 0
+    from . import scanner
+
+    try:
+        with os.scandir(root) as iterator:
+            entries = list(iterator)
+    except OSError:
+        return None
+    # DirEntry type checks reuse readdir data instead of extra lstat calls.
+    regular = [entry for entry in entries if not entry.is_symlink()]
+    files = []
+    for entry in regular:
+        if not entry.is_dir(follow_symlinks=False):
+            supported = scanner.is_supported(entry.name)
+            files.append((entry.path, _entry_size(entry) if supported else 0, supported))
+    subdirs = [entry.path for entry in regular if entry.is_dir(follow_symlinks=False)]
+    return files, subdirs, len(entries) - len(regular)
+
+
+def _validated_roots(paths: List[str]) -> List[str]:
+    """
+    Return the absolute form of each input path, raising if any is not a directory.
+    """
+    roots: List[str] = []
     for path in paths:
         normalized = os.path.abspath(path)
-        if not os.path.exists(normalized):
-            raise NolossiaError(f"One or more input paths are invalid.\n  Offending path: {path}")
-        if not os.path.isdir(normalized):
+        if not os.path.isdir(normalized):  # Also covers missing paths; same message either way
             raise NolossiaError(f"One or more input paths are invalid.\n  Offending path: {path}")
-        for root, dirs, files in os.walk(normalized, topdown=True, followlinks=False):
-            safe_dirs: List[str] = []
-            for dirname in dirs:
-                dir_path = os.path.join(root, dirname)
-                if os.path.islink(dir_path):
-                    skipped_symlinks += 1
-                    continue
-                safe_dirs.append(dirname)
-            dirs[:] = safe_dirs
-            for name in files:
-                file_path = os.path.abspath(os.path.join(root, name))
-                if os.path.islink(file_path):
-                    skipped_symlinks += 1
+        roots.append(normalized)
+    return roots
+
+
+def _collect_files(paths: List[str]) -> tuple[List[tuple[str, int, bool]], int]:
+    """
+    Collect all files under provided paths for summary purposes.
+    Returns ((path, size, supported) entries, skipped symlink count); sizes come from the
+    walk's DirEntry and are only read for supported files.
+
+    Directories are listed level by level on a thread pool so many scandir calls are
+    in flight at once; results are reassembled in depth-first order afterwards.
+    """
+    roots = _validated_roots(paths)
+
+    listings: dict[str, tuple[List[tuple[str, int, bool]], List[str], int] | None] = {}
+    frontier = list(dict.fromkeys(roots))
+    queued = set(frontier)
+    executor = None
+    try:
+        while frontier:
+            if len(frontier) == 1:
+                results = [_list_directory(frontier[0])]
+            else:
+                if executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    executor = ThreadPoolExecutor(max_workers=io_workers(4, metadata_bound=True))
+                results = list(executor.map(_list_directory, frontier))
+            next_frontier: List[str] = []
+            for directory, listing in zip(frontier, results):
+                listings[directory] = listing
+                if listing is None:
                     continue
-                all_files.append(file_path)
+                for subdir in listing[1]:
+                    if subdir not in queued:
+                        queued.add(subdir)
+                        next_frontier.append(subdir)
+            frontier = next_frontier
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    all_files: List[tuple[str, int, bool]] = []
+    skipped_symlinks = 0
+    for root in roots:
+        pending = [root]
+        while pending:
+            listing = listings.get(pending.pop())
+            if listing is None:
+                continue
+            files, subdirs, symlinks = listing
+            all_files.extend(files)
+            skipped_symlinks += symlinks
+            pending.extend(reversed(subdirs))
     return all_files, skipped_symlinks
 
 
@@ -739,10 +910,10 @@ def _partition_clusters(clusters: List[DuplicateCluster]) -> Tuple[List[Duplicat
     exact = []
     near = []
     for cluster in clusters:
-        if _is_exact_cluster(cluster):
-            exact.append(cluster)
-        else:
-            near.append(cluster)
+        is_exact = cluster.is_exact
+        if is_exact is None:
+            is_exact = _is_exact_cluster(cluster)
+        (exact if is_exact else near).append(cluster)
     return exact, near
 
 
@@ -770,12 +941,21 @@ def _link_with_fallback(formatter: CLIFormatter, path: str, label: str) -> str:
     return f"{link_text} (open {path})"
 
 
+if os.name == "nt" or sys.platform.startswith("win"):
+    _OPEN_CMD_TEMPLATE = 'start "" "{}"'
+elif sys.platform.startswith("darwin"):
+    _OPEN_CMD_TEMPLATE = 'open "{}"'
+else:
+    _OPEN_CMD_TEMPLATE = 'xdg-open "{}"'
+
+
 def _report_open_command(path: str) -> str:
-    if os.name == "nt" or sys.platform.startswith("win"):
-        return f'start "" "{path}"'
-    if sys.platform.startswith("darwin"):
-        return f'open "{path}"'
-    return f'xdg-open "{path}"'
+    return _OPEN_CMD_TEMPLATE.format(path)
+
+
+_FAILURE_KV_TEMPLATE = (
+    "status=%s phase=%s reason=%s last_step=%s files_changed=%s remediation=%s log=%s reports=%s\n"
+)
 
 
 def _emit_pipe_failure(
@@ -810,13 +990,21 @@ def _emit_pipe_failure(
         reports_value = ",".join(payload["reports"]) if payload["reports"] else "-"
         remediation_value = ";".join(remediation) if remediation else "-"
         last_step_value = payload.get("last_step") or "-"
-        line = (
-            f"status={payload['status']} phase={phase} reason={reason} last_step={last_step_value} "
-            f"files_changed={files_changed} remediation={remediation_value} log={log_path} reports={reports_value}"
+        target.write(
+            _FAILURE_KV_TEMPLATE
+            % (
+                payload["status"],
+                phase,
+                reason,
+                last_step_value,
+                files_changed,
+                remediation_value,
+                log_path,
+                reports_value,
+            )
         )
-        target.write(line + "\n")
         return
-    target.write(json.dumps(payload, separators=(",", ":")) + "\n")
+    target.write(_compact_json_encoder()(payload) + "\n")
 
 
 def _render_failure_summary(
@@ -832,15 +1020,11 @@ def _render_failure_summary(
     artifacts: list[str] | None = None,
 ) -> None:
     log_path = _current_log_path()
-    artifact_paths = artifacts or []
-    absolute_artifacts: list[str] = []
-    seen: set[str] = set()
-    for path in artifact_paths:
-        normalized = os.path.abspath(path)
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        absolute_artifacts.append(normalized)
+    # Artifacts come from reporting.artifact_path and are already absolute; only
+    # relative stragglers need abspath (and its getcwd) before the ordered dedupe.
+    absolute_artifacts = list(
+        dict.fromkeys(path if os.path.isabs(path) else os.path.abspath(path) for path in artifacts or [])
+    )
     _emit_pipe_failure(
         formatter,
         status=status,
@@ -861,18 +1045,20 @@ def _render_failure_summary(
     normalized_status = status.upper()
     header_label = "FAILURE" if normalized_status == "FAILED" else normalized_status
     header = f"{header_label} SUMMARY — {phase}"
-    formatter.failure_summary(
-        header=header,
-        reason=reason,
-        last_step=last_step,
-        files_changed=files_changed,
-        log_hint=log_hint,
-        artifacts=formatted_artifacts,
-        remediation=remediation,
-        details=details,
-    )
+    with formatter.batch():
+        formatter.failure_summary(
+            header=header,
+            reason=reason,
+            last_step=last_step,
+            files_changed=files_changed,
+            log_hint=log_hint,
+            artifacts=formatted_artifacts,
+            remediation=remediation,
+            details=details,
+        )
 
 
+@lru_cache(maxsize=16)
 def _destination_prompt_message(current_default: str) -> str:
     """
     Build destination prompt hint with explicit default instructions.
@@ -909,21 +1095,26 @@ def _scan_flow(
     """
     Implements Phase 6 scan → dedupe → merge wizard.
     """
-
     previous_glossary = formatter.config.show_glossary
     formatter.config.show_glossary = show_glossary
-    if show_banner:
+    pipe_mode = formatter.config.pipe_mode
+    if show_banner and not pipe_mode:
         formatter.print_banner()
     total_steps = 2 if quick_mode else 3
-    step_title = "Quick Scan & Plan" if quick_mode else "Scan & Inventory"
-    step_subtitle = "scan + duplicate analysis (read-only)" if quick_mode else "read-only pass over selected folders"
-    _render_step_header(formatter, 1, total_steps, step_title, step_subtitle)
-
-    all_files, _ = _collect_files(paths)
-    supported_files = scanner.filter_supported_files(all_files)
-    total_size_supported = sum(os.path.getsize(p) for p in supported_files)
+    if not pipe_mode:
+        step_title = "Quick Scan & Plan" if quick_mode else "Scan & Inventory"
+        step_subtitle = "scan + duplicate analysis (read-only)" if quick_mode else "read-only pass over selected folders"
+        _render_step_header(formatter, 1, total_steps, step_title, step_subtitle)
+
+    if pipe_mode:
+        # The pipe summary carries no size, so only validate the paths instead of walking them twice.
+        _validated_roots(paths)
+        total_size_supported = 0
+    else:
+        all_files, _ = _collect_files(paths)
+        total_size_supported = sum(size for _, size, supported in all_files if supported)
 
-    hashed, clusters, skipped_total, skipped_symlinks = _scan_and_group(paths, formatter=formatter)
+    hashed, clusters, skipped_total, skipped_symlinks, _ = _scan_and_group(paths, formatter=formatter)
     total_photos = len(hashed)
     if total_photos == 0:
         formatter.warning("No supported image files were found in the provided locations.")
@@ -937,6 +1128,25 @@ def _scan_flow(
         "skipped": skipped_total,
         "skipped_symlinks": skipped_symlinks,
     }
+    if pipe_mode:
+        _emit_pipe_summary(
+            formatter,
+            status=_PIPE_PHASE_SCAN,
+            phase=_PIPE_PHASE_SCAN,
+            masters=total_photos,
+            duplicates=0,
+            near=0,
+            required="0B",
+            available="0B",
+            review=0,
+            skipped=skipped_total,
+            reports=[],
+            review_samples=[],
+            storage_breakdown={},
+        )
+        formatter.config.show_glossary = previous_glossary
+        return
+
     if quick_mode:
         summary_rows = [
             ("Photos", f"{total_photos:,}"),
@@ -995,26 +1205,6 @@ def _scan_flow(
             ],
         )
 
-    if formatter.config.pipe_mode:
-        _emit_pipe_summary(
-            formatter,
-            status="scan",
-            phase="scan",
-            masters=total_photos,
-            duplicates=0,
-            near=0,
-            required="0B",
-            available="0B",
-            review=0,
-            skipped=skipped_total,
-            reports=[],
-            review_samples=[],
-            storage_breakdown={},
-        )
-    if formatter.config.pipe_mode:
-        formatter.config.show_glossary = previous_glossary
-        return
-
     prompt_message = (
         "→ Continue to quick plan? [y/N] (Enter cancels): " if quick_mode else "→ Proceed to the next step? [y/N] (Enter cancels): "
     )
@@ -1065,14 +1255,15 @@ def _scan_fast_flow(
     """
     previous_glossary = formatter.config.show_glossary
     formatter.config.show_glossary = show_glossary
-    if show_banner:
-        formatter.print_banner()
-    _render_step_header(formatter, 1, 1, "Scan (fast)", "read-only inventory summary")
+    if not formatter.config.pipe_mode:
+        if show_banner:
+            formatter.print_banner()
+        _render_step_header(formatter, 1, 1, "Scan (fast)", "read-only inventory summary")
 
     all_files, skipped_symlinks = _collect_files(paths)
-    supported_files = scanner.filter_supported_files(all_files)
-    total_size_supported = sum(os.path.getsize(p) for p in supported_files)
-    total_photos = len(supported_files)
+    supported_sizes = [size for _, size, supported in all_files if supported]
+    total_size_supported = sum(supported_sizes)
+    total_photos = len(supported_sizes)
     skipped_total = max(0, len(all_files) - total_photos)
 
     if total_photos == 0:
@@ -1081,6 +1272,25 @@ def _scan_fast_flow(
         formatter.config.show_glossary = previous_glossary
         return
 
+    if formatter.config.pipe_mode:
+        _emit_pipe_summary(
+            formatter,
+            status=_PIPE_STATUS_SCAN_FAST,
+            phase=_PIPE_PHASE_SCAN,
+            masters=total_photos,
+            duplicates=0,
+            near=0,
+            required="0B",
+            available="0B",
+            review=0,
+            skipped=skipped_total,
+            reports=[],
+            review_samples=[],
+            storage_breakdown={},
+        )
+        formatter.config.show_glossary = previous_glossary
+        return
+
     summary_rows = [
         ("Supported photos", f"{total_photos:,}"),
         ("Total size", human_readable_size(total_size_supported)),
@@ -1107,23 +1317,6 @@ def _scan_fast_flow(
             "Run merge wizard to simulate changes.",
         ],
     )
-
-    if formatter.config.pipe_mode:
-        _emit_pipe_summary(
-            formatter,
-            status="scan_fast",
-            phase="scan",
-            masters=total_photos,
-            duplicates=0,
-            near=0,
-            required="0B",
-            available="0B",
-            review=0,
-            skipped=skipped_total,
-            reports=[],
-            review_samples=[],
-            storage_breakdown={},
-        )
     formatter.config.show_glossary = previous_glossary
 
 
@@ -1140,7 +1333,9 @@ def _dedupe_flow(
     """
     Display dedupe summary and optionally proceed to merge.
     """
-    if not quick_mode:
+    from . import reporting
+
+    if not quick_mode and not formatter.config.pipe_mode:
         _render_step_header(
             formatter,
             2,
@@ -1153,6 +1348,24 @@ def _dedupe_flow(
     report_path = reporting.artifact_path("dedupe_report.html")
     reporting.write_dedupe_report(hashed, clusters, report_path, unique_size)
 
+    if formatter.config.pipe_mode:
+        _emit_pipe_summary(
+            formatter,
+            status=_PIPE_PHASE_DEDUPE,
+            phase=_PIPE_PHASE_DEDUPE,
+            masters=stats["masters"],
+            duplicates=stats["exact_redundant"],
+            near=stats["near_redundant"],
+            required="0B",
+            available="0B",
+            review=0,
+            skipped=skipped_files,
+            reports=[report_path],
+            review_samples=[],
+            storage_breakdown={},
+        )
+        return False, stats
+
     if quick_mode:
         formatter.blank()
         formatter.line(formatter.label("Quick duplicate check", level="info"))
@@ -1187,25 +1400,6 @@ def _dedupe_flow(
             ],
         )
 
-    if formatter.config.pipe_mode:
-        _emit_pipe_summary(
-            formatter,
-            status="dedupe",
-            phase="dedupe",
-            masters=stats["masters"],
-            duplicates=stats["exact_redundant"],
-            near=stats["near_redundant"],
-            required="0B",
-            available="0B",
-            review=0,
-            skipped=skipped_files,
-            reports=[report_path],
-            review_samples=[],
-            storage_breakdown={},
-        )
-    if formatter.config.pipe_mode:
-        return False, stats
-
     prompt_message = (
         "→ Build the preview-only plan now? (no changes yet) [y/N] (Enter exits): "
         if quick_mode
@@ -1237,23 +1431,29 @@ def _merge_flow(
     """
     Merge setup, preview-only (no changes yet), and optional execution.
     """
+    from . import merge_engine, reporting
+    from .cli_formatter import CLIFormatter
+
     if formatter is None:
         formatter = CLIFormatter()
     _ensure_run_log_path()
 
-    if show_banner and not formatter.config.pipe_mode:
+    pipe_mode = formatter.config.pipe_mode
+    if show_banner and not pipe_mode:
         formatter.print_banner()
 
-    scan_totals = scan_totals or {
-        "supported": len(hashed),
-        "size": sum((f.size or 0) for f in hashed),
-        "skipped": skipped_files,
-        "skipped_symlinks": 0,
-    }
-    unique_size_estimate = _estimate_unique_size(hashed, clusters)
-    dedupe_stats = dedupe_stats or _calculate_dedupe_stats(hashed, clusters, unique_size_estimate)
-
-    if show_intro and not formatter.config.pipe_mode:
+    if show_intro and not pipe_mode:
+        # Intro totals are display-only; every pipeline caller already passes both, so the
+        # fallbacks only run for direct invocations.
+        scan_totals = scan_totals or {
+            "supported": len(hashed),
+            "size": _total_size(hashed),
+            "skipped": skipped_files,
+            "skipped_symlinks": 0,
+        }
+        if dedupe_stats is None:
+            unique_size_estimate = _estimate_unique_size(hashed, clusters)
+            dedupe_stats = _calculate_dedupe_stats(hashed, clusters, unique_size_estimate)
         _render_mode_label(formatter, "PREVIEW")
         _render_step_header(formatter, 1, 3, "Scan & Inventory", "read-only pass over selected folders")
         _render_summary_box(
@@ -1282,7 +1482,7 @@ def _merge_flow(
             ],
         )
 
-    if not formatter.config.pipe_mode:
+    if not pipe_mode:
         formatter.blank()
         formatter.line(formatter.label("MERGE SETUP — Destination validation", level="info"))
         formatter.muted("Enter or confirm the destination folder for the merged library:")
@@ -1306,12 +1506,13 @@ def _merge_flow(
                     "Select an empty or YEAR/YEAR-MONTH destination before retrying.",
                     "Copy/paste example: /Library/2024/2024-05",
                 ],
-                artifacts=_DEFAULT_ARTIFACTS,
+                artifacts=_default_artifacts(),
             )
             raise SystemExit(0)
         candidate = os.path.abspath(target_input)
-        formatter.blank()
-        formatter.line("Analyzing destination folder...")
+        if not pipe_mode:
+            formatter.blank()
+            formatter.line("Analyzing destination folder...")
         dest_reporter: Callable[[str], None] | None = None
         if formatter.config.verbose:
             def dest_reporter(message: str) -> None:
@@ -1333,14 +1534,15 @@ def _merge_flow(
             )
             target_default = candidate
 
-    if not formatter.config.pipe_mode:
+    if not pipe_mode:
         formatter.section("[1] Building merge plan...", icon=None)
     try:
         plan = merge_engine.build_merge_plan(
             hashed, clusters, target_abs, mode="on", skipped_files=skipped_files
         )
     except StorageError as exc:
-        required_size = human_readable_size(_estimate_unique_size(hashed, clusters))
+        unique_size = dedupe_stats["unique_size"] if dedupe_stats else _estimate_unique_size(hashed, clusters)
+        required_size = human_readable_size(unique_size)
         available = human_readable_size(merge_engine.available_space(target_abs))
         _render_failure_summary(
             formatter,
@@ -1357,17 +1559,17 @@ def _merge_flow(
                 ("Required storage", required_size),
                 ("Available space", available),
             ],
-            artifacts=_DEFAULT_ARTIFACTS,
+            artifacts=_default_artifacts(),
         )
         raise SystemExit(1)
 
     merge_engine.dry_run(plan)
-    summary = _build_merge_summary(plan, clusters, target_abs, paths, hashed)
-    plan_reports = summary.get("reports", []) or _DEFAULT_ARTIFACTS
+    summary = _build_merge_summary(plan, clusters, target_abs, paths, include_chronology=not pipe_mode)
+    plan_reports = summary.get("reports", []) or _default_artifacts()
     pipe_status = (
         None
-        if (execute_requested and formatter.config.pipe_mode and not formatter.config.stream_json)
-        else "dry_run"
+        if (execute_requested and pipe_mode and not formatter.config.stream_json)
+        else _PIPE_STATUS_DRY_RUN
     )
     _print_merge_plan_summary(
         summary,
@@ -1377,14 +1579,14 @@ def _merge_flow(
         storage_warning=plan.required_space > plan.destination_free,
     )
 
-    if formatter.config.pipe_mode and not execute_requested:
+    if pipe_mode and not execute_requested:
         return
 
     if not execute_requested:
         formatter.muted("Preview only (no changes yet). Review the plan, then decide whether to move files.")
         return
 
-    confirm = "EXECUTE" if formatter.config.pipe_mode else _prompt(
+    confirm = "EXECUTE" if pipe_mode else _prompt(
         formatter,
         "Type 'EXECUTE' to move files now (Enter cancels): ",
         default="",
@@ -1405,8 +1607,8 @@ def _merge_flow(
         )
         raise SystemExit(0)
 
-    _render_mode_label(formatter, "EXECUTE")
-    if not formatter.config.pipe_mode:
+    if not pipe_mode:
+        _render_mode_label(formatter, "EXECUTE")
         formatter.section(f"[MERGE PHASE {total_steps}/{total_steps} - EXECUTE]", icon="⇒")
         formatter.info("Executing merge plan…")
         formatter.warning("EXECUTE is live. Files will move now.")
@@ -1442,12 +1644,16 @@ def _merge_flow(
             artifacts=plan_reports,
         )
         raise SystemExit(1)
-    summary = _build_merge_summary(plan, clusters, target_abs, paths, hashed)
-    if formatter.config.pipe_mode:
+    # Execution only mutates the plan when it renames a destination; otherwise the
+    # preview summary already describes the executed plan exactly.
+    # Neither the executed pipe line nor the success block shows chronology.
+    if execution_metadata.get("renamed"):
+        summary = _build_merge_summary(plan, clusters, target_abs, paths, include_chronology=False)
+    if pipe_mode:
         _emit_pipe_summary(
             formatter,
-            status="executed",
-            phase="merge",
+            status=_PIPE_STATUS_EXECUTED,
+            phase=_PIPE_PHASE_MERGE,
             masters=summary["masters_count"],
             duplicates=summary["exact_to_quar_count"],
             near=summary["near_marks"],
@@ -1461,135 +1667,144 @@ def _merge_flow(
         )
         return
 
-    formatter.success("✓ Merge execution complete")
-    formatter.kv("Files moved", str(summary["masters_count"]))
-    formatter.kv("Isolated for safety", str(summary["exact_to_quar_count"]))
-    formatter.kv("Look-alikes marked", str(summary["near_marks"]))
-    rename_events = execution_metadata.get("renamed", [])
-    if rename_events:
-        formatter.warning("Filename collisions resolved with hash suffixes:")
-        preview = rename_events[:5]
-        for original, new in preview:
-            formatter.line(f"  - {os.path.basename(original)} → {os.path.basename(new)}")
-        if len(rename_events) > len(preview):
-            formatter.muted(
-                f"... +{len(rename_events) - len(preview)} more renames. "
-                f"See {reporting.LOG_FILE_NAME} for the full list."
-            )
-    formatter.blank()
-    formatter.line("To view the results you can now open:")
-    formatter.bullet(_link_with_fallback(formatter, summary["merge_report_path"], "merge_report.html"))
-    formatter.bullet(_link_with_fallback(formatter, summary["dedupe_report_path"], "dedupe_report.html"))
-    formatter.line("The previous dedupe_report.html was refreshed after EXECUTE to avoid stale guidance.")
+    with formatter.batch():
+        formatter.success("✓ Merge execution complete")
+        formatter.kv("Files moved", str(summary["masters_count"]))
+        formatter.kv("Isolated for safety", str(summary["exact_to_quar_count"]))
+        formatter.kv("Look-alikes marked", str(summary["near_marks"]))
+        rename_events = execution_metadata.get("renamed", [])
+        if rename_events:
+            formatter.warning("Filename collisions resolved with hash suffixes:")
+            preview = rename_events[:5]
+            for original, new in preview:
+                formatter.line(f"  - {original.rpartition(os.sep)[2]} → {new.rpartition(os.sep)[2]}")
+            if len(rename_events) > len(preview):
+                formatter.muted(
+                    f"... +{len(rename_events) - len(preview)} more renames. "
+                    f"See {reporting.LOG_FILE_NAME} for the full list."
+                )
+        formatter.blank()
+        formatter.line("To view the results you can now open:")
+        formatter.bullet(_link_with_fallback(formatter, summary["merge_report_path"], "merge_report.html"))
+        formatter.bullet(_link_with_fallback(formatter, summary["dedupe_report_path"], "dedupe_report.html"))
+        formatter.line("The previous dedupe_report.html was refreshed after EXECUTE to avoid stale guidance.")
 
 
 def _print_destination_warning(formatter: CLIFormatter) -> None:
     """
     Display destination structure warning per Phase 6.
     """
-    formatter.warning("⚠ Destination is not empty nor YEAR/YEAR-MONTH structured.")
-    formatter.line("To continue, pick one of these remediation options:")
-    formatter.line("Fix 1: Reorganize this folder into YEAR/YEAR-MONTH.")
-    formatter.bullet(
-        "[1] Reorganize this folder into YEAR/YEAR-MONTH (e.g., /Library/2024/2024-05), then select option 1 to re-check.",
-        indent="    ",
-    )
-    formatter.line("Fix 2: Choose a different destination folder.")
-    formatter.bullet(
-        "[2] Choose a different empty or already chronological folder (you'll be prompted again).",
-        indent="    ",
+    with formatter.batch():
+        formatter.warning("⚠ Destination is not empty nor YEAR/YEAR-MONTH structured.")
+        formatter.line("To continue, pick one of these remediation options:")
+        formatter.line("Fix 1: Reorganize this folder into YEAR/YEAR-MONTH.")
+        formatter.bullet(
+            "[1] Reorganize this folder into YEAR/YEAR-MONTH (e.g., /Library/2024/2024-05), then select option 1 to re-check.",
+            indent="    ",
+        )
+        formatter.line("Fix 2: Choose a different destination folder.")
+        formatter.bullet(
+            "[2] Choose a different empty or already chronological folder (you'll be prompted again).",
+            indent="    ",
+        )
+        formatter.bullet(
+            "[Enter] Leave the next prompt empty to cancel merge setup with no changes.",
+            indent="    ",
+        )
+        formatter.line("Copy/paste example: /Library/2024/2024-05")
+        formatter.line("Docs: CLI_COMMANDS.md (destination requirements)")
+
+
+@dataclass
+class _ActionIndex:
+    """
+    Destination columns for MOVE_MASTER actions, derived in a single pass.
+    """
+
+    dsts: List[str]
+    dirnames: List[str]
+    year_months: Counter[tuple[str, str]]  # (year, year_month) -> count
+
+
+def _index_actions(actions: Sequence[MergeAction], out_path: str) -> _ActionIndex:
+    """
+    Compute destination paths, folders, and year/month buckets once for all summaries.
+    """
+    from .models.actions import MoveMasterAction
+
+    dsts = [action.dst for action in actions if isinstance(action, MoveMasterAction)]
+    # Destinations under an absolute out_path are sliced; relpath (and its abspath calls)
+    # only runs for anything outside it.
+    out_prefix = out_path.rstrip(os.sep) + os.sep
+    rel_parts = (
+        (dst[len(out_prefix):] if dst.startswith(out_prefix) else os.path.relpath(dst, out_path)).split(os.sep, 2)
+        for dst in dsts
     )
-    formatter.bullet(
-        "[Enter] Leave the next prompt empty to cancel merge setup with no changes.",
-        indent="    ",
+    return _ActionIndex(
+        dsts=dsts,
+        # Plan destinations are absolute and normalized, so one rpartition matches dirname.
+        dirnames=[dst.rpartition(os.sep)[0] or os.sep for dst in dsts],
+        year_months=Counter((parts[0], parts[1]) for parts in rel_parts if len(parts) >= 2),
     )
-    formatter.line("Copy/paste example: /Library/2024/2024-05")
-    formatter.line("Docs: CLI_COMMANDS.md (destination requirements)")
 
 
-def _format_year_month_breakdown(actions: Sequence[MergeAction], out_path: str) -> str:
+def _format_year_month_breakdown(index: _ActionIndex) -> str:
     """
     Build compact YEAR/YEAR-MONTH breakdown from move actions.
     """
     counter: Counter[str] = Counter()
-    for action in actions:
-        if isinstance(action, MoveMasterAction):
-            rel = os.path.relpath(action.dst, out_path)
-            parts = rel.split(os.sep)
-            if len(parts) >= 2:
-                year, year_month = parts[0], parts[1]
-                counter[f"{year}/{year_month}"] += 1
+    for (year, year_month), count in index.year_months.items():
+        counter[f"{year}/{year_month}"] += count
     if not counter:
         return "No chronological mapping detected"
     return ", ".join(f"{key} : {value} photos" for key, value in sorted(counter.items()))
 
 
-def _collect_review_actions(actions: List[MergeAction], out_path: str) -> list[MoveMasterAction]:
-    """
-    Return MOVE_MASTER actions targeting the REVIEW/ bucket.
-    """
-    review_root = os.path.join(os.path.abspath(out_path), "REVIEW")
-    matches: list[MoveMasterAction] = []
-    for action in actions:
-        if not isinstance(action, MoveMasterAction):
-            continue
-        dst = os.path.abspath(action.dst)
-        try:
-            if os.path.commonpath([dst, review_root]) == review_root:
-                matches.append(action)
-        except ValueError:
-            continue
-    return matches
-
-
 def _review_samples(actions: list[MoveMasterAction], out_path: str, limit: int = 5) -> list[str]:
     """
     Build a short list of REVIEW file paths relative to the destination.
     """
+    from .review import describe_review_reason
+
     base = os.path.abspath(out_path)
+    base_prefix = base.rstrip(os.sep) + os.sep
     samples: list[str] = []
-    for action in actions:
-        rel = os.path.relpath(os.path.abspath(action.dst), base)
-        if rel.startswith(".."):
-            rel = os.path.basename(action.dst)
+    for action in islice(actions, limit):
+        dst = action.dst
+        if dst.startswith(base_prefix):
+            rel = dst[len(base_prefix):]  # Absolute, normalized plan path under the destination
+        else:
+            rel = os.path.relpath(os.path.abspath(dst), base)
+            if rel.startswith(".."):
+                rel = os.path.basename(dst)
         reason_text = describe_review_reason(getattr(action, "review_reason", None))
-        entry = rel if not reason_text else f"{rel} — {reason_text}"
-        samples.append(entry)
-        if len(samples) >= limit:
-            break
+        samples.append(rel if not reason_text else f"{rel} — {reason_text}")
     return samples
 
 
-def _count_folder_merges(actions: List[MergeAction]) -> int:
+def _count_folder_merges(index: _ActionIndex) -> int:
     """
     Count folders receiving multiple files (merge collisions risk).
     """
-    folder_counts = Counter(os.path.dirname(action.dst) for action in actions if isinstance(action, MoveMasterAction))
+    folder_counts = Counter(index.dirnames)
     return sum(1 for count in folder_counts.values() if count > 1)
 
 
-def _count_filename_collisions(actions: List[MergeAction]) -> int:
+def _count_filename_collisions(index: _ActionIndex) -> int:
     """
     Count filename collisions based on planned destinations.
     """
-    dest_counts = Counter(action.dst for action in actions if isinstance(action, MoveMasterAction))
+    dest_counts = Counter(index.dsts)
     return sum(count - 1 for count in dest_counts.values() if count > 1)
 
 
-def _chronology_rows(actions: List[MergeAction], out_path: str, limit: int = 5) -> list[tuple[str, int, str]]:
+def _chronology_rows(index: _ActionIndex, limit: int = 5) -> list[tuple[str, int, str]]:
     """
     Build sorted chronology rows (Year-Month, count, percent).
     """
     counter: Counter[str] = Counter()
-    for action in actions:
-        if not isinstance(action, MoveMasterAction):
-            continue
-        rel = os.path.relpath(action.dst, out_path)
-        parts = rel.split(os.sep)
-        if len(parts) >= 2:
-            year, year_month = parts[0], parts[1]
-            label = f"{year}-{year_month[-2:]}"
-            counter[label] += 1
+    for (year, year_month), count in index.year_months.items():
+        counter[f"{year}-{year_month[-2:]}"] += count
     total = sum(counter.values()) or 1
     rows: list[tuple[str, int, str]] = []
     for label, count in counter.most_common(limit):
@@ -1602,47 +1817,66 @@ def _chronology_rows(actions: List[MergeAction], out_path: str, limit: int = 5)
     return rows
 
 
+def _dst_sort_key(action: MergeAction) -> tuple[str, str]:
+    """
+    Sort by (folder, filename); plan destinations are normalized, so one rpartition splits both.
+    """
+    head, _, tail = action.dst.rpartition(os.sep)
+    return head, tail
+
+
+@lru_cache(maxsize=8)
+def _source_paths_label(cwd: str, source_paths: tuple[str, ...]) -> str:
+    """
+    Render sorted absolute source paths; keyed on cwd so relative paths stay correct.
+    """
+    absolute = (os.path.normpath(os.path.join(cwd, path)) for path in source_paths)
+    return ", ".join(sorted(absolute))
+
+
 def _build_merge_summary(
     plan: MergePlan,
     clusters: List[DuplicateCluster],
     out_path: str,
     source_paths: List[str],
-    files: List[FileInfo],
+    *,
+    include_chronology: bool = True,
 ) -> dict:
     """
     Prepare merge summary values for CLI output.
+
+    include_chronology=False skips the display-only YEAR/YEAR-MONTH breakdown and
+    chronology rows (pipe output and the post-execute block never render them).
     """
+    from . import reporting
+
     exact_clusters, near_clusters = _partition_clusters(clusters)
-    actions = plan.actions
-    masters_actions = sorted(
-        (a for a in actions if isinstance(a, MoveMasterAction)),
-        key=lambda action: (os.path.dirname(action.dst), os.path.basename(action.dst)),
-    )
-    near_mark_actions = sorted(
-        (a for a in actions if isinstance(a, MarkNearDuplicateAction)),
-        key=lambda action: (action.master, action.src),
-    )
+    # The plan arrives partitioned by action kind; only the display order is applied here.
+    kept_actions = plan.master_actions
+    review_actions = sorted(plan.review_actions, key=_dst_sort_key)
+    masters_actions = sorted(kept_actions + plan.review_actions, key=_dst_sort_key)
+    near_mark_actions = sorted(plan.near_duplicate_actions, key=attrgetter("master", "src"))
+    exact_quarantine_actions = sorted(plan.exact_quarantine_actions, key=_dst_sort_key)
     near_marks = len(near_mark_actions)
-    near_marks_size_bytes = sum(a.size or 0 for a in near_mark_actions)
+    near_marks_size_bytes = _total_size(near_mark_actions)
     near_marks_size = human_readable_size(near_marks_size_bytes)
-    exact_quarantine_actions = sorted(
-        (a for a in actions if isinstance(a, MoveToQuarantineExactAction)),
-        key=lambda action: (os.path.dirname(action.dst), os.path.basename(action.dst)),
-    )
-    exact_quarantine_size = sum(a.size or 0 for a in exact_quarantine_actions)
+    exact_quarantine_size = _total_size(exact_quarantine_actions)
     quarantine_path = (
         os.path.dirname(exact_quarantine_actions[0].dst) if exact_quarantine_actions else os.path.join(out_path, "QUARANTINE_EXACT")
     )
 
-    year_month_breakdown = _format_year_month_breakdown(masters_actions, out_path)
+    action_index = _index_actions(masters_actions, out_path)
+    if include_chronology:
+        year_month_breakdown = _format_year_month_breakdown(action_index)
+        chrono_rows = _chronology_rows(action_index)
+    else:
+        year_month_breakdown = ""
+        chrono_rows = []
     free_after = max(plan.destination_free - plan.required_space, 0)
-    chrono_rows = _chronology_rows(masters_actions, out_path)
 
-    review_actions = _collect_review_actions(masters_actions, out_path)
     review_samples = _review_samples(review_actions, out_path)
-    review_ids = {id(action) for action in review_actions}
-    masters_storage_bytes = sum((action.size or 0) for action in masters_actions if id(action) not in review_ids)
-    review_storage_bytes = sum((action.size or 0) for action in review_actions)
+    masters_storage_bytes = _total_size(kept_actions)
+    review_storage_bytes = _total_size(review_actions)
     storage_breakdown_bytes = {
         "masters": masters_storage_bytes,
         "quarantine": exact_quarantine_size,
@@ -1650,9 +1884,10 @@ def _build_merge_summary(
     }
     storage_breakdown = {key: human_readable_size(value) for key, value in storage_breakdown_bytes.items()}
     masters_total_size = storage_breakdown_bytes["masters"] + storage_breakdown_bytes["review"]
+    report_paths = {name: reporting.artifact_path(name) for name in _MERGE_REPORT_NAMES}
 
     return {
-        "source_paths": ", ".join(sorted(os.path.abspath(p) for p in source_paths)),
+        "source_paths": _source_paths_label(os.getcwd(), tuple(source_paths)),
         "out_path": os.path.abspath(out_path),
         "required": human_readable_size(plan.required_space),
         "free": human_readable_size(plan.destination_free),
@@ -1668,103 +1903,101 @@ def _build_merge_summary(
         "near_marks_size": near_marks_size,
         "year_month_breakdown": year_month_breakdown,
         "chronology_rows": chrono_rows,
-        "missing_exif_count": sum(1 for f in files if f.exif_datetime is None),
+        "missing_exif_count": plan.missing_exif_count,
         "review_count": len(review_actions),
         "review_samples": review_samples,
         "storage_breakdown": storage_breakdown,
         "storage_breakdown_bytes": storage_breakdown_bytes,
-        "folder_merges_count": _count_folder_merges(masters_actions),
-        "filename_collisions_count": _count_filename_collisions(masters_actions),
+        "folder_merges_count": _count_folder_merges(action_index),
+        "filename_collisions_count": _count_filename_collisions(action_index),
         "corrupt_count": plan.skipped_files,
         "quarantine_path": quarantine_path,
-        "mergeplan_json_path": reporting.artifact_path("merge_plan.json"),
-        "dedupe_report_path": reporting.artifact_path("dedupe_report.html"),
-        "merge_report_path": reporting.artifact_path("merge_report.html"),
-        "manifest_json_path": reporting.artifact_path("source_manifest.json"),
-        "manifest_csv_path": reporting.artifact_path("source_manifest.csv"),
-        "manifest_html_path": reporting.artifact_path("source_manifest.html"),
-        "reports": [
-            reporting.artifact_path("merge_plan.json"),
-            reporting.artifact_path("dedupe_report.html"),
-            reporting.artifact_path("merge_report.html"),
-            reporting.artifact_path("source_manifest.json"),
-            reporting.artifact_path("source_manifest.csv"),
-            reporting.artifact_path("source_manifest.html"),
-        ],
+        "mergeplan_json_path": report_paths["merge_plan.json"],
+        "dedupe_report_path": report_paths["dedupe_report.html"],
+        "merge_report_path": report_paths["merge_report.html"],
+        "manifest_json_path": report_paths["source_manifest.json"],
+        "manifest_csv_path": report_paths["source_manifest.csv"],
+        "manifest_html_path": report_paths["source_manifest.html"],
+        "reports": list(report_paths.values()),
     }
 
 
+# (label, str.format_map template over the _build_merge_summary dict)
+_SUMMARY_ROW_SPEC = (
+    ("Masters storage", "{storage_breakdown[masters]} • {masters_count:,} files"),
+    ("Exact → Isolated for safety storage", "{storage_breakdown[quarantine]} • {exact_to_quar_count:,} files"),
+    ("Set aside for review storage", "{storage_breakdown[review]} • {review_count:,} files"),
+    ("Look-alike marks", "{near_marks:,} ({near_marks_size})"),
+    ("Required storage (total)", "{required}"),
+    ("Free space", "{free}"),
+    ("Free after merge", "{free_after}"),
+    ("Skipped files", "{corrupt_count}"),
+)
+
+
 def _print_merge_plan_summary(
     summary: dict,
     formatter: CLIFormatter,
     *,
-    pipe_status: str | None = "dry_run",
+    pipe_status: str | None = _PIPE_STATUS_DRY_RUN,
     total_steps: int = 3,
     storage_warning: bool = False,
 ) -> None:
     """
     Render merge plan summary per Phase 6 spec.
     """
+    cfg = formatter.config
+    pipe_mode = cfg.pipe_mode
+    masters_count = summary["masters_count"]
+    exact_count = summary["exact_to_quar_count"]
+    review_count = summary["review_count"]
+    near_marks = summary["near_marks"]
+    corrupt_count = summary["corrupt_count"]
+    collisions_count = summary["filename_collisions_count"]
+    breakdown = summary["storage_breakdown"]
+    review_samples = summary.get("review_samples")
     statuses = [
-        ("ok", "Merge plan generated", f"{summary['masters_count']:,} masters scheduled"),
-        ("ok", "Exact duplicates isolated for safety", f"{summary['exact_to_quar_count']:,} files"),
+        ("ok", "Merge plan generated", f"{masters_count:,} masters scheduled"),
+        ("ok", "Exact duplicates isolated for safety", f"{exact_count:,} files"),
     ]
-    if summary["filename_collisions_count"]:
-        statuses.append(("warn", "Filename collisions detected", f"{summary['filename_collisions_count']} planned renames"))
-    if summary["corrupt_count"]:
-        statuses.append(("warn", "Skipped unreadable files", str(summary["corrupt_count"])))
+    if collisions_count:
+        statuses.append(("warn", "Filename collisions detected", f"{collisions_count} planned renames"))
+    if corrupt_count:
+        statuses.append(("warn", "Skipped unreadable files", str(corrupt_count)))
 
     _render_step_header(formatter, total_steps, total_steps, "Preview-only simulation", "storage planning & duplicate routing")
-    summary_rows = [
-        (
-            "Masters storage",
-            f"{summary['storage_breakdown']['masters']} • {summary['masters_count']:,} files",
-        ),
-        (
-            "Exact → Isolated for safety storage",
-            f"{summary['storage_breakdown']['quarantine']} • {summary['exact_to_quar_count']:,} files",
-        ),
-        (
-            "Set aside for review storage",
-            f"{summary['storage_breakdown']['review']} • {summary['review_count']:,} files",
-        ),
-        ("Look-alike marks", f"{summary['near_marks']:,} ({summary['near_marks_size']})"),
-        ("Required storage (total)", summary["required"]),
-        ("Free space", summary["free"]),
-        ("Free after merge", summary["free_after"]),
-        ("Skipped files", str(summary["corrupt_count"])),
-    ]
+    summary_rows = [(label, template.format_map(summary)) for label, template in _SUMMARY_ROW_SPEC]
     _render_summary_box(formatter, summary_rows)
-    if not formatter.config.pipe_mode:
+    if not pipe_mode:
         formatter.muted(
             "RAW + sidecars: RAW files stay intact; sidecars (e.g., .xmp) are not processed. "
             "Keep them next to RAW files and copy them after the merge."
         )
-    if formatter.config.verbose:
+    if cfg.verbose:
         _render_status_block(formatter, statuses)
-    if summary.get("review_samples") and not formatter.config.pipe_mode:
+    if review_samples and not pipe_mode:
         formatter.blank()
         formatter.line(formatter.label("Sample review files", level="info"))
-        for entry in summary["review_samples"]:
+        for entry in review_samples:
             formatter.bullet(entry, indent="  - ")
         formatter.muted("Full review listings will be captured in merge_report.html after changes are applied.")
     if pipe_status:
         _emit_pipe_summary(
             formatter,
             status=pipe_status,
-            phase="merge",
-            masters=summary["masters_count"],
-            duplicates=summary["exact_to_quar_count"],
-            near=summary["near_marks"],
+            phase=_PIPE_PHASE_MERGE,
+            masters=masters_count,
+            duplicates=exact_count,
+            near=near_marks,
             required=summary["required"],
             available=summary["free"],
-            review=summary["review_count"],
-            skipped=summary["corrupt_count"],
+            review=review_count,
+            skipped=corrupt_count,
             reports=summary.get("reports", []),
             review_samples=summary.get("review_samples", []),
-            storage_breakdown=summary.get("storage_breakdown", {}),
+            storage_breakdown=breakdown,
         )
-    if formatter.config.pipe_mode:
+    if pipe_mode:
         return
     _render_chronology_table(formatter, summary.get("chronology_rows", []))
     formatter.muted(f"Destination: {summary['out_path']}")
@@ -1789,16 +2022,14 @@ def _print_merge_plan_summary(
         warnings.append(
             f"{summary['folder_merges_count']} folders will receive multiple masters. Verify YEAR/YEAR-MONTH structure."
         )
-    if summary["filename_collisions_count"]:
-        warnings.append(
-            f"{summary['filename_collisions_count']} filename collisions will be resolved with hash suffixes."
-        )
+    if collisions_count:
+        warnings.append(f"{collisions_count} filename collisions will be resolved with hash suffixes.")
     _render_warnings_frame(formatter, warnings)
 
     next_steps = [
         "Review the reports above first.",
     ]
-    if summary["review_count"]:
+    if review_count:
         next_steps.append("Check the set-aside-for-review list before you decide.")
     next_steps.append("Nothing moves until you confirm the execute step. Re-run when you are ready to move files.")
     _render_next_steps(formatter, next_steps)
@@ -1808,19 +2039,32 @@ def _estimate_unique_size(files: List[FileInfo], clusters: List[DuplicateCluster
     """
     Estimate unique size counting one master per cluster plus singletons.
     """
-    unique_paths: set[str] = set()
-    size = 0
+    from . import duplicates
+
+    master_sizes: dict[str, int] = {}
     for cluster in clusters:
         master = cluster.master or duplicates.select_master(cluster)
-        if master.path not in unique_paths:
-            unique_paths.add(master.path)
-            size += master.size
+        master_sizes.setdefault(master.path, master.size)
+    # Masters are members of their clusters, so unclustered files never overlap them.
     clustered_paths = {f.path for c in clusters for f in c.files}
-    for file in files:
-        if file.path not in clustered_paths and file.path not in unique_paths:
-            unique_paths.add(file.path)
-            size += file.size
-    return size
+    return sum(master_sizes.values()) + sum(f.size for f in files if f.path not in clustered_paths)
+
+
+def _redundant_size(cluster: DuplicateCluster) -> int:
+    if cluster.redundant_size is not None:
+        return cluster.redundant_size
+    return _total_size(cluster.redundant)
+
+
+def _redundant_totals(clusters: List[DuplicateCluster]) -> tuple[int, int]:
+    """
+    Return (redundant file count, redundant bytes) for clusters in one pass.
+    """
+    count = size = 0
+    for cluster in clusters:
+        count += len(cluster.redundant)
+        size += _redundant_size(cluster)
+    return count, size
 
 
 def _calculate_dedupe_stats(
@@ -1829,11 +2073,9 @@ def _calculate_dedupe_stats(
     unique_size: int,
 ) -> dict:
     exact_clusters, near_clusters = _partition_clusters(clusters)
-    exact_redundant = sum(len(c.redundant) for c in exact_clusters)
-    near_redundant = sum(len(c.redundant) for c in near_clusters)
+    exact_redundant, exact_size = _redundant_totals(exact_clusters)
+    near_redundant, near_size = _redundant_totals(near_clusters)
     masters = len(hashed) - exact_redundant - near_redundant
-    exact_size = sum(f.size for c in exact_clusters for f in c.redundant)
-    near_size = sum(f.size for c in near_clusters for f in c.redundant)
     duplicate_total = exact_redundant + near_redundant
     duplicate_size_total = exact_size + near_size
     return {
@@ -1850,104 +2092,55 @@ def _calculate_dedupe_stats(
     }
 
 
-def main():
-    """
-    Argument parser entry point.
-
-    Args:
-        None
+_SUBCOMMANDS = ("start", "scan", "dedupe", "organize", "merge", "undo")
+_SUBCOMMAND_METAVAR = "{" + ",".join(_SUBCOMMANDS) + "}"
+_COLOR_CHOICES = ("auto", "always", "never")
+_THEME_CHOICES = ("light", "dark", "high-contrast-light", "high-contrast-dark")
+_MODE_CHOICES = ("auto", "tty", "plain", "pipe")
+_PIPE_FORMAT_CHOICES = ("json", "kv")
+_EXECUTOR_CHOICES = ("auto", "process", "thread")
+_MAX_PIXELS_HELP = (
+    f"Override Pillow decompression guard (default {DEFAULT_PIXEL_LIMIT} pixels). "
+    f"Maximum allowed is {MAX_OVERRIDE_LIMIT}. Also configurable via ${PIXEL_LIMIT_ENV}."
+)
+_EXECUTOR_HELP = (
+    "Executor mode for hashing/metadata: auto (default), process, or thread. "
+    f"Also configurable via ${EXECUTOR_ENV}."
+)
+_GLOBAL_VALUE_FLAGS = frozenset({"--color", "--theme", "--mode", "--pipe-format", "--max-pixels", "--executor"})
+_GLOBAL_SWITCH_FLAGS = frozenset(
+    {"--no-banner", "--no-color", "--plain", "--ascii", "--docs-alias", "--verbose", "--stream-json"}
+)
 
-    Returns:
-        None
 
-    Raises:
-        SystemExit: When execution fails.
+def _sniff_subcommand(argv: Sequence[str]) -> str | None:
     """
-    parser = argparse.ArgumentParser(
-        prog="nolossia",
-        description="Nolossia CLI. Designed to prevent data loss.",
-        epilog="Docs alias: /docs/cli (CLI_COMMANDS.md quick reference).",
-    )
-    parser.add_argument(
-        "--no-banner",
-        action="store_true",
-        help="Suppress the Nolossia banner (also disables Unicode art).",
-    )
-    parser.add_argument(
-        "--no-color",
-        action="store_true",
-        help="Disable ANSI colors regardless of terminal support.",
-    )
-    parser.add_argument(
-        "--plain",
-        action="store_true",
-        help="Plain mode: no banner, ASCII-only separators, no ANSI colors.",
-    )
-    parser.add_argument(
-        "--ascii",
-        dest="force_ascii",
-        action="store_true",
-        help="Force ASCII output even if the terminal supports Unicode.",
-    )
-    parser.add_argument(
-        "--color",
-        choices=["auto", "always", "never"],
-        default=None,
-        help="Force color usage: auto (default), always, or never.",
-    )
-    parser.add_argument(
-        "--theme",
-        choices=["light", "dark", "high-contrast-light", "high-contrast-dark"],
-        default="light",
-        help="Theme palette: light (default), dark, high-contrast-light, or high-contrast-dark.",
-    )
-    parser.add_argument(
-        "--docs-alias",
-        action="store_true",
-        help="Print docs alias path: /docs/cli (quick reference).",
-    )
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Print duplicate rule decisions and destination validation steps.",
-    )
-    parser.add_argument(
-        "--mode",
-        choices=["auto", "tty", "plain", "pipe"],
-        default="auto",
-        help="Force output mode: auto (default), tty, plain, or pipe (single-line).",
-    )
-    parser.add_argument(
-        "--pipe-format",
-        choices=["json", "kv"],
-        default="json",
-        help="When writing to pipe/redirect, output single-line JSON (default) or key/value pairs.",
-    )
-    parser.add_argument(
-        "--stream-json",
-        action="store_true",
-        help="When in pipe mode, emit JSON progress events for each phase (JSON format only).",
-    )
-    parser.add_argument(
-        "--max-pixels",
-        type=_pixel_limit_arg,
-        default=None,
-        help=(
-            f"Override Pillow decompression guard (default {DEFAULT_PIXEL_LIMIT} pixels). "
-            f"Maximum allowed is {MAX_OVERRIDE_LIMIT}. Also configurable via ${PIXEL_LIMIT_ENV}."
-        ),
-    )
-    parser.add_argument(
-        "--executor",
-        choices=["auto", "process", "thread"],
-        default=None,
-        help=(
-            "Executor mode for hashing/metadata: auto (default), process, or thread. "
-            f"Also configurable via ${EXECUTOR_ENV}."
-        ),
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
+    Return the subcommand named in argv, skipping global flags and their values.
+    Returns None for help requests (including abbreviations like --he), for any
+    flag that is not an exact global option (argparse may expand it as a prefix),
+    or when no known subcommand is found.
+    """
+    expect_value = False
+    for token in argv:
+        if expect_value:
+            expect_value = False
+            continue
+        if token == "-h" or (len(token) >= 3 and "--help".startswith(token)):
+            return None
+        if token.startswith("-"):
+            name = token.split("=", 1)[0]
+            if name not in _GLOBAL_VALUE_FLAGS and name not in _GLOBAL_SWITCH_FLAGS:
+                return None
+            expect_value = name == token and name in _GLOBAL_VALUE_FLAGS
+            continue
+        return token if token in _SUBCOMMANDS else None
+    return None
 
+
+def _add_start_parser(subparsers) -> None:
+    """
+    Register the `start` subcommand.
+    """
     start_parser = subparsers.add_parser(
         "start",
         help="Interactive launcher with banner, intro, and glossary",
@@ -1971,6 +2164,11 @@ def main():
     )
     start_parser.set_defaults(glossary=True)
 
+
+def _add_scan_parser(subparsers) -> None:
+    """
+    Register the `scan` subcommand.
+    """
     scan_parser = subparsers.add_parser(
         "scan",
         help="Scan directories for photos",
@@ -1993,6 +2191,11 @@ def main():
         help="Quick mode: shorter wizard output with fewer steps (read-only).",
     )
 
+
+def _add_dedupe_parser(subparsers) -> None:
+    """
+    Register the `dedupe` subcommand.
+    """
     dedupe_parser = subparsers.add_parser(
         "dedupe",
         help="Analyze duplicate and look-alike photos",
@@ -2004,6 +2207,11 @@ def main():
     )
     dedupe_parser.add_argument("paths", nargs="+", help="One or more paths to analyze")
 
+
+def _add_organize_parser(subparsers) -> None:
+    """
+    Register the `organize` subcommand.
+    """
     organize_parser = subparsers.add_parser(
         "organize",
         help="Preview chronological organization plan",
@@ -2017,6 +2225,11 @@ def main():
     organize_parser.add_argument("paths", nargs="+", help="One or more paths to organize")
     organize_parser.add_argument("--out", required=True, help="Destination library path for organization preview")
 
+
+def _add_merge_parser(subparsers) -> None:
+    """
+    Register the `merge` subcommand.
+    """
     merge_parser = subparsers.add_parser(
         "merge",
         help="Merge photos into a unified library with preview-only (no changes yet) and safety checks",
@@ -2042,6 +2255,11 @@ def main():
     merge_group.add_argument("--execute", dest="dry_run", action="store_false", help="Execute merge after confirmation")
     merge_parser.set_defaults(dry_run=True)
 
+
+def _add_undo_parser(subparsers) -> None:
+    """
+    Register the `undo` subcommand.
+    """
     undo_parser = subparsers.add_parser(
         "undo",
         help="Undo a prior merge using the source manifest",
@@ -2054,11 +2272,132 @@ def main():
     undo_parser.add_argument("--last", action="store_true", help="Undo the last merge")
     undo_parser.add_argument("--preview", action="store_true", help="Preview undo actions without moving files")
 
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser. When a subcommand is known up front only that
+    subparser is wired; otherwise all subcommands are registered so help,
+    usage, and invalid-choice errors stay complete.
+    """
+    parser = argparse.ArgumentParser(
+        prog="nolossia",
+        description="Nolossia CLI. Designed to prevent data loss.",
+        epilog="Docs alias: /docs/cli (CLI_COMMANDS.md quick reference).",
+    )
+    parser.add_argument(
+        "--no-banner",
+        action="store_true",
+        help="Suppress the Nolossia banner (also disables Unicode art).",
+    )
+    parser.add_argument(
+        "--no-color",
+        action="store_true",
+        help="Disable ANSI colors regardless of terminal support.",
+    )
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="Plain mode: no banner, ASCII-only separators, no ANSI colors.",
+    )
+    parser.add_argument(
+        "--ascii",
+        dest="force_ascii",
+        action="store_true",
+        help="Force ASCII output even if the terminal supports Unicode.",
+    )
+    parser.add_argument(
+        "--color",
+        choices=_COLOR_CHOICES,
+        default=None,
+        help="Force color usage: auto (default), always, or never.",
+    )
+    parser.add_argument(
+        "--theme",
+        choices=_THEME_CHOICES,
+        default="light",
+        help="Theme palette: light (default), dark, high-contrast-light, or high-contrast-dark.",
+    )
+    parser.add_argument(
+        "--docs-alias",
+        action="store_true",
+        help="Print docs alias path: /docs/cli (quick reference).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print duplicate rule decisions and destination validation steps.",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=_MODE_CHOICES,
+        default="auto",
+        help="Force output mode: auto (default), tty, plain, or pipe (single-line).",
+    )
+    parser.add_argument(
+        "--pipe-format",
+        choices=_PIPE_FORMAT_CHOICES,
+        default="json",
+        help="When writing to pipe/redirect, output single-line JSON (default) or key/value pairs.",
+    )
+    parser.add_argument(
+        "--stream-json",
+        action="store_true",
+        help="When in pipe mode, emit JSON progress events for each phase (JSON format only).",
+    )
+    parser.add_argument(
+        "--max-pixels",
+        type=_pixel_limit_arg,
+        default=None,
+        help=_MAX_PIXELS_HELP,
+    )
+    parser.add_argument(
+        "--executor",
+        choices=_EXECUTOR_CHOICES,
+        default=None,
+        help=_EXECUTOR_HELP,
+    )
+    selected = (command,) if command in _SUBCOMMANDS else _SUBCOMMANDS
+    # Keep usage lines identical to the full parser when only one subparser is wired.
+    metavar = _SUBCOMMAND_METAVAR if len(selected) == 1 else None
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar=metavar)
+    builders = {
+        "start": _add_start_parser,
+        "scan": _add_scan_parser,
+        "dedupe": _add_dedupe_parser,
+        "organize": _add_organize_parser,
+        "merge": _add_merge_parser,
+        "undo": _add_undo_parser,
+    }
+    for name in selected:
+        builders[name](subparsers)
+    return parser
+
+
+def main():
+    """
+    Argument parser entry point.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: When execution fails.
+    """
+    parser = _build_parser(_sniff_subcommand(sys.argv[1:]))
+
     args = parser.parse_args()
     if args.docs_alias:
         print("Docs alias: /docs/cli (CLI_COMMANDS.md quick reference)")
         raise SystemExit(0)
 
+    import io
+
+    from . import reporting
+    from .cli_formatter import CLIFormatter, detect_terminal_capabilities
+
     pixel_limit, pixel_source = configure_pixel_limit(args.max_pixels)
     formatter_config = detect_terminal_capabilities(
         color_preference=args.color or "auto",
@@ -2124,13 +2463,13 @@ def main():
                     show_glossary=False,
                 )
         elif args.command == "dedupe":
-            hashed, clusters, skipped, skipped_symlinks = _scan_and_group(args.paths, formatter=formatter)
+            hashed, clusters, skipped, skipped_symlinks, total_size = _scan_and_group(args.paths, formatter=formatter)
             unique_size = _estimate_unique_size(hashed, clusters)
             proceed, stats = _dedupe_flow(args.paths, hashed, clusters, unique_size, formatter, skipped_files=skipped)
             if proceed:
                 scan_summary = {
                     "supported": len(hashed),
-                    "size": sum((f.size or 0) for f in hashed),
+                    "size": total_size,
                     "skipped": skipped,
                     "skipped_symlinks": skipped_symlinks,
                 }
@@ -2146,19 +2485,22 @@ def main():
                     dedupe_stats=stats,
                 )
         elif args.command == "organize":
+            from . import hashing, metadata, organizer, scanner
+
             fileinfos = scanner.scan_paths(args.paths)
             enriched = metadata.enrich_metadata(fileinfos)
             hashed = hashing.add_hashes(enriched)
+            source_root = os.path.commonpath(args.paths)
+            label = formatter.label("NEW", level="success")
             for fileinfo in hashed:
                 target = organizer.determine_target_path(
-                    fileinfo, args.out, merge_mode="on", source_root=os.path.commonpath(args.paths)
+                    fileinfo, args.out, merge_mode="on", source_root=source_root
                 )
-                label = formatter.label("NEW", level="success")
                 formatter.line(f"{label} {fileinfo.path} -> {target}")
             reporting.write_log([f"[INFO] Organization plan generated for {len(hashed)} files"])
 
         elif args.command == "merge":
-            if not formatter.config.pipe_mode:
+            if not formatter_config.pipe_mode:
                 _render_settings_tiers(
                     formatter,
                     execute_requested=not args.dry_run,
@@ -2166,20 +2508,20 @@ def main():
                     destination_path=args.out,
                 )
                 _render_sensitivity_banner(formatter)
-            hashed, clusters, skipped, skipped_symlinks = _scan_and_group(args.paths, formatter=formatter)
+            hashed, clusters, skipped, skipped_symlinks, total_size = _scan_and_group(args.paths, formatter=formatter)
             scan_summary = {
                 "supported": len(hashed),
-                "size": sum((f.size or 0) for f in hashed),
+                "size": total_size,
                 "skipped": skipped,
                 "skipped_symlinks": skipped_symlinks,
             }
             unique_size = _estimate_unique_size(hashed, clusters)
             stats = _calculate_dedupe_stats(hashed, clusters, unique_size)
-            if formatter.config.pipe_mode and formatter.config.stream_json:
+            if formatter_config.pipe_mode and formatter_config.stream_json:
                 _emit_pipe_summary(
                     formatter,
-                    status="scan",
-                    phase="scan",
+                    status=_PIPE_PHASE_SCAN,
+                    phase=_PIPE_PHASE_SCAN,
                     masters=scan_summary["supported"],
                     duplicates=0,
                     near=0,
@@ -2193,8 +2535,8 @@ def main():
                 )
                 _emit_pipe_summary(
                     formatter,
-                    status="dedupe",
-                    phase="dedupe",
+                    status=_PIPE_PHASE_DEDUPE,
+                    phase=_PIPE_PHASE_DEDUPE,
                     masters=stats["masters"],
                     duplicates=stats["exact_redundant"],
                     near=stats["near_redundant"],
@@ -2219,7 +2561,7 @@ def main():
                 dedupe_stats=stats,
             )
         elif args.command == "undo":
-            if formatter.config.pipe_mode:
+            if formatter_config.pipe_mode:
                 _render_failure_summary(
                     formatter,
                     status="BLOCKED",
@@ -2230,7 +2572,7 @@ def main():
                         "Re-run undo in interactive mode (tty/plain/ascii).",
                         "PIPE_SCHEMA.md does not define an undo contract yet.",
                     ],
-                    artifacts=_UNDO_ARTIFACTS,
+                    artifacts=_undo_artifacts(),
                 )
                 sys.exit(2)
             if args.last and args.operation_id:
@@ -2241,7 +2583,7 @@ def main():
                     reason="Choose either --last or an explicit operation_id, not both.",
                     last_step="Undo argument validation",
                     remediation=["Run 'nolossia undo --last' or 'nolossia undo <operation_id>'."],
-                    artifacts=_UNDO_ARTIFACTS,
+                    artifacts=_undo_artifacts(),
                 )
                 sys.exit(1)
             if not args.last and not args.operation_id:
@@ -2252,11 +2594,13 @@ def main():
                     reason="Missing operation id. Provide --last or an operation_id.",
                     last_step="Undo argument validation",
                     remediation=["Run 'nolossia undo --last' or 'nolossia undo <operation_id>'."],
-                    artifacts=_UNDO_ARTIFACTS,
+                    artifacts=_undo_artifacts(),
                 )
                 sys.exit(1)
             operation_id = args.operation_id
             if args.last:
+                from . import merge_engine
+
                 try:
                     operation_id, _ = merge_engine.load_source_manifest(
                         reporting.artifact_path("source_manifest.json")
@@ -2272,7 +2616,7 @@ def main():
                             "Run a merge with --execute to generate a source manifest.",
                             "Verify artifacts/source_manifest.json exists.",
                         ],
-                        artifacts=_UNDO_ARTIFACTS,
+                        artifacts=_undo_artifacts(),
                     )
                     sys.exit(1)
             exit_code = _undo_flow(operation_id, args.preview, formatter)
@@ -2291,7 +2635,7 @@ def main():
                 "Re-run the command when ready.",
                 "Inspect nolossia.log for any partial progress details.",
             ],
-            artifacts=_DEFAULT_ARTIFACTS,
+            artifacts=_default_artifacts(),
         )
         sys.exit(1)
     except NolossiaError as exc:
@@ -2307,7 +2651,7 @@ def main():
                 "Review the error message and nolossia.log for details.",
                 "Address the reported issue, then rerun the command.",
             ],
-            artifacts=_DEFAULT_ARTIFACTS,
+            artifacts=_default_artifacts(),
         )
         sys.exit(1)
     except Exception as exc:  # pragma: no cover - defensive catch for CLI UX
@@ -2323,7 +2667,7 @@ def main():
                 "Inspect nolossia.log for the traceback.",
                 "Report the issue with the captured log if it persists.",
             ],
-            artifacts=_DEFAULT_ARTIFACTS,
+            artifacts=_default_artifacts(),
         )
         sys.exit(1)
 
@@ -5,51 +5,36 @@ Purpose: Centralized CLI formatting utilities enforcing Nolossia output contract
 
 from __future__ import annotations
 
+import io
 import os
 import re
 import shutil
 import sys
-import textwrap
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Iterable, TextIO
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, TextIO
 
 from .utils import BOLD, COLOR_RESET, color_256, osc8_link
 
+if TYPE_CHECKING:
+    import textwrap
+
 DEFAULT_LINE_WIDTH = 96
 DEFAULT_KV_WIDTH = 32
 PRIMARY_INDENT = "  "
 BULLET_INDENT = f"{PRIMARY_INDENT}- "
 ANSI_SGR_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 OSC8_PATTERN = re.compile(r"\x1b]8;;.*?\x1b\\")
-THEME_PALETTES: dict[str, dict[str, int]] = {
-    "light": {
-        "primary": 74,
-        "accent": 141,
-        "ok": 64,
-        "warn": 221,
-        "error": 160,
-        "link": 33,
-        "muted": 243,
-    },
-    "dark": {
-        "primary": 75,
-        "accent": 105,
-        "ok": 64,
-        "warn": 221,
-        "error": 160,
-        "link": 33,
-        "muted": 245,
-    },
-    "high-contrast-light": {
-        "primary": 21,
-        "accent": 75,
-        "ok": 46,
-        "warn": 226,
-        "error": 196,
-        "link": 27,
-        "muted": 250,
-    },
-    "high-contrast-dark": {
+# Either escape form in one alternation, so width checks make a single regex pass.
+_CONTROL_PATTERN = re.compile(f"{ANSI_SGR_PATTERN.pattern}|{OSC8_PATTERN.pattern}")
+# Bound pattern methods for the kv/bullet/frame width checks.
+_CONTROL_SUB = _CONTROL_PATTERN.sub
+_CONTROL_SEARCH = _CONTROL_PATTERN.search
+# Palettes are shared read-only views; both high-contrast themes use one palette.
+_HIGH_CONTRAST_PALETTE: Mapping[str, int] = MappingProxyType(
+    {
         "primary": 21,
         "accent": 75,
         "ok": 46,
@@ -57,7 +42,33 @@ THEME_PALETTES: dict[str, dict[str, int]] = {
         "error": 196,
         "link": 27,
         "muted": 250,
-    },
+    }
+)
+THEME_PALETTES: dict[str, Mapping[str, int]] = {
+    "light": MappingProxyType(
+        {
+            "primary": 74,
+            "accent": 141,
+            "ok": 64,
+            "warn": 221,
+            "error": 160,
+            "link": 33,
+            "muted": 243,
+        }
+    ),
+    "dark": MappingProxyType(
+        {
+            "primary": 75,
+            "accent": 105,
+            "ok": 64,
+            "warn": 221,
+            "error": 160,
+            "link": 33,
+            "muted": 245,
+        }
+    ),
+    "high-contrast-light": _HIGH_CONTRAST_PALETTE,
+    "high-contrast-dark": _HIGH_CONTRAST_PALETTE,
 }
 THEME_DISPLAY_NAMES = {
     "light": "light",
@@ -102,8 +113,20 @@ class CLIFormatter:
     ) -> None:
         self.config = config or FormatterConfig()
         self.stream = stream or sys.stdout
+        self._batching = False
         self.line_width = DEFAULT_LINE_WIDTH
+        self._columns: int | None = None
         self.palette = _resolve_palette(self.config.theme)
+        self._c_primary = self.palette["primary"]
+        self._c_accent = self.palette["accent"]
+        self._c_link = self.palette["link"]
+        self._label_colors = _label_colors(self.palette)
+        self._osc8_on = self.config.osc8_links and self.config.use_color and not self.config.plain_mode
+        # (prefix, suffix) per line level; config is fixed once the formatter exists.
+        self._styles = _line_styles(self.palette, self.config.use_color)
+        if not self.config.use_color:
+            # Plain and pipe runs never style; skip _style's checks on every call.
+            self._style = self._plain_style
 
     # ------------------------------------------------------------------ banners
     def print_banner(self) -> None:
@@ -120,7 +143,7 @@ class CLIFormatter:
         if not version_value.lower().startswith("v"):
             version_value = f"v{version_value}"
         theme_label = THEME_DISPLAY_NAMES.get(self.config.theme, self.config.theme)
-        columns = shutil.get_terminal_size((80, 20)).columns
+        columns = self._terminal_columns()
 
         full_lockup = f"Nolossia — {tagline} ({version_value}) • Theme {theme_label}"
         short_lockup = f"Nolossia ({version_value})"
@@ -138,10 +161,9 @@ class CLIFormatter:
                 " ▀██▀    ██▄▀███▀▄██▄▀███▀█▄▄██▀█▄▄██▀▄██▄▀█▄██",
                 lockup,
             ]
-            for line in logo_lines:
-                self._write(self._style(line, self.palette["primary"], bold=True))
+            self.list_lines(self._style(line, self._c_primary, bold=True) for line in logo_lines)
             return
-        self._write(self._style(lockup, self.palette["primary"], bold=True))
+        self._write(self._style(lockup, self._c_primary, bold=True))
 
     # ------------------------------------------------------------------- styles
     def line(self, text: str = "") -> None:
@@ -162,23 +184,23 @@ class CLIFormatter:
         else:
             label = title
         self.blank()
-        self._write(self._style(label, self.palette["primary"], bold=True))
+        self._write(self._style(label, self._c_primary, bold=True))
 
     def info(self, text: str) -> None:
         """Print informational text."""
-        self._write(self._style(text, self.palette["primary"]))
+        self._emit("info", text)
 
     def success(self, text: str) -> None:
         """Print success text."""
-        self._write(self._style(text, self.palette["ok"], bold=True))
+        self._emit("success", text)
 
     def warning(self, text: str) -> None:
         """Print warning text."""
-        self._write(self._style(text, self.palette["warn"], bold=True))
+        self._emit("warning", text)
 
     def error(self, text: str) -> None:
         """Print error text."""
-        self._write(self._style(text, self.palette["error"], bold=True))
+        self._emit("error", text)
 
     def failure_summary(
         self,
@@ -220,24 +242,19 @@ class CLIFormatter:
         """
         width = min(self.line_width, DEFAULT_LINE_WIDTH)
         unicode = self.config.unicode_enabled and not self.config.plain_mode
-        horiz = "─" if unicode else "-"
-        vert = "│" if unicode else "|"
-        tl, tr, bl, br = ("┌", "┐", "└", "┘") if unicode else ("+", "+", "+", "+")
-        title_text = f"{horiz} {title} "
-        top = f"{tl}{title_text}{horiz * max(0, width - 2 - len(title_text))}{tr}"
-        self.line(top)
-        content_width = width - 4
+        top, bottom, vert, content_width = _frame_borders(title, width, unicode)
+        row = f"{vert} {{:<{content_width}}} {vert}".format
+        rows = [top]
         for line in lines:
-            wrapped = textwrap.wrap(line, width=content_width) or [""]
-            for chunk in wrapped:
-                self.line(f"{vert} {chunk.ljust(content_width)} {vert}")
-        bottom = f"{bl}{horiz * (width - 2)}{br}"
-        self.line(bottom)
+            wrapped = _wrap(line, content_width) or [""]
+            rows.extend(map(row, wrapped))
+        rows.append(bottom)
+        self.list_lines(rows)
 
     def divider(self, width: int = DEFAULT_LINE_WIDTH) -> None:
         """Print a horizontal divider line."""
         char = "─" if self.config.unicode_enabled else "-"
-        self._write(self._style(char * width, self.palette["accent"]))
+        self._write(self._style(char * width, self._c_accent))
 
     def kv(self, label: str, value: str, width: int = DEFAULT_KV_WIDTH, indent: int = 1) -> None:
         """Print an aligned key/value line with wrapping support."""
@@ -253,12 +270,9 @@ class CLIFormatter:
         if available < 10 or self._visible_length(value) <= available:
             self._write(line)
             return
-        wrapped = textwrap.wrap(value, width=available) or [value]
-        for index, chunk in enumerate(wrapped):
-            if index == 0:
-                self._write(prefix + chunk)
-            else:
-                self._write(" " * prefix_len + chunk)
+        wrapped = _wrap(value, available) or [value]
+        continuation = " " * prefix_len
+        self.list_lines([prefix + wrapped[0], *(continuation + chunk for chunk in wrapped[1:])])
 
     def bullet(self, text: str, indent: str | None = None) -> None:
         """Print a bullet item respecting layout width."""
@@ -271,53 +285,65 @@ class CLIFormatter:
         if available < 10 or self._visible_length(text) <= available:
             self._write(f"{indent_str}{text}")
             return
-        wrapped = textwrap.wrap(text, width=available) or [text]
-        for index, chunk in enumerate(wrapped):
-            if index == 0:
-                self._write(f"{indent_str}{chunk}")
-            else:
-                self._write(" " * prefix_len + chunk)
+        wrapped = _wrap(text, available) or [text]
+        continuation = " " * prefix_len
+        self.list_lines([indent_str + wrapped[0], *(continuation + chunk for chunk in wrapped[1:])])
 
     def list_lines(self, lines: Iterable[str]) -> None:
-        """Print multiple lines sequentially."""
-        for line in lines:
-            self._write(line)
+        """Print multiple lines with a single buffered write."""
+        buffered = list(lines)
+        if buffered:
+            self._write("\n".join(buffered))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Collect output written inside the block and emit it with one write and flush.
+        Nested batches join the outermost one. Do not prompt for input inside a batch.
+        """
+        if self._batching:
+            yield
+            return
+        target = self.stream
+        buffer = io.StringIO()
+        self.stream = buffer
+        self._batching = True
+        try:
+            yield
+        finally:
+            self.stream = target
+            self._batching = False
+            text = buffer.getvalue()
+            if text:
+                target.write(text)
+                target.flush()
 
     def prompt(self, message: str) -> str:
         """Return a formatted prompt string for input()."""
-        return self._style(message, self.palette["accent"], bold=True)
+        return self._style(message, self._c_accent, bold=True)
 
     def link(self, path: str, label: str | None = None) -> str:
         """Return a styled hyperlink for capable terminals."""
         target = label or path
-        if not self.config.use_color or not self._osc8_enabled():
-            return target
-        if not self._osc8_enabled():
+        if not self._osc8_on:
             return target
-        return self._style(osc8_link(path, target), self.palette["link"])
+        return self._style(osc8_link(path, target), self._c_link)
 
     def muted(self, text: str) -> None:
         """Print muted informational text."""
-        self._write(self._style(text, self.palette["muted"]))
+        self._emit("muted", text)
 
     def verbose(self, text: str) -> None:
         """Print verbose diagnostics when enabled."""
         if not self.config.verbose:
             return
-        self.muted(f"[verbose] {text}")
+        # Same output as muted(); the "[verbose] " text is never empty, so always wrap.
+        prefix, suffix = self._styles["muted"]
+        self.stream.write(f"{prefix}[verbose] {text}{suffix}\n")
 
     def label(self, text: str, level: str = "info", *, bold: bool = True) -> str:
         """Return a styled inline label for embedding in other strings."""
-        color = {
-            "info": self.palette["primary"],
-            "accent": self.palette["accent"],
-            "success": self.palette["ok"],
-            "warn": self.palette["warn"],
-            "error": self.palette["error"],
-            "muted": self.palette["muted"],
-        }.get(level, self.palette["primary"])
-        if level == "plain":
-            color = None
+        color = None if level == "plain" else self._label_colors.get(level, self._c_primary)
         return self._style(text, color, bold=bold)
 
     def style(self, text: str, color: str | None = None, *, bold: bool = False) -> str:
@@ -328,6 +354,14 @@ class CLIFormatter:
     def _write(self, text: str) -> None:
         self.stream.write(text + "\n")
 
+    def _emit(self, level: str, text: str) -> None:
+        prefix, suffix = self._styles[level]
+        if prefix and text:
+            # Build the styled line with its newline in one string instead of via _write.
+            self.stream.write(f"{prefix}{text}{suffix}\n")
+        else:
+            self._write(text)
+
     def _style(self, text: str, color: str | None = None, bold: bool = False) -> str:
         if not self.config.use_color or not text:
             return text
@@ -340,17 +374,28 @@ class CLIFormatter:
             return text
         return f"{prefix}{text}{COLOR_RESET}"
 
+    @staticmethod
+    def _plain_style(text: str, color: str | None = None, bold: bool = False) -> str:
+        return text
+
     @staticmethod
     def _visible_length(text: str) -> int:
-        stripped = ANSI_SGR_PATTERN.sub("", text)
-        return len(OSC8_PATTERN.sub("", stripped))
+        # Both escape forms start with ESC; plain text skips the regex engine.
+        if "\x1b" not in text:
+            return len(text)
+        return _styled_visible_length(text)
 
     @staticmethod
     def _contains_control(text: str) -> bool:
-        return bool(ANSI_SGR_PATTERN.search(text) or OSC8_PATTERN.search(text))
+        if "\x1b" not in text:
+            return False
+        return _CONTROL_SEARCH(text) is not None
 
-    def _osc8_enabled(self) -> bool:
-        return self.config.osc8_links and self.config.use_color and not self.config.plain_mode
+    def _terminal_columns(self) -> int:
+        # Queried on first use only, so pipe runs never probe the terminal.
+        if self._columns is None:
+            self._columns = shutil.get_terminal_size((80, 20)).columns
+        return self._columns
 
 
 def detect_terminal_capabilities(
@@ -373,12 +418,13 @@ def detect_terminal_capabilities(
     if stdout_isatty is None:
         stdout_isatty = sys.stdout.isatty()
 
-    env_no_color = bool(os.environ.get("NO_COLOR"))
-    env_plain = bool(os.environ.get("NOLOSSIA_PLAIN"))
-    env_force_ascii = bool(os.environ.get("NOLOSSIA_FORCE_ASCII"))
-    env_no_banner = bool(os.environ.get("NOLOSSIA_NO_BANNER"))
-    env_force_osc8 = bool(os.environ.get("NOLOSSIA_FORCE_OSC8"))
-    env_disable_osc8 = bool(os.environ.get("NOLOSSIA_DISABLE_OSC8"))
+    env_get = os.environ.get
+    env_no_color = bool(env_get("NO_COLOR"))
+    env_plain = bool(env_get("NOLOSSIA_PLAIN"))
+    env_force_ascii = bool(env_get("NOLOSSIA_FORCE_ASCII"))
+    env_no_banner = bool(env_get("NOLOSSIA_NO_BANNER"))
+    env_force_osc8 = bool(env_get("NOLOSSIA_FORCE_OSC8"))
+    env_disable_osc8 = bool(env_get("NOLOSSIA_DISABLE_OSC8"))
     auto_pipe = mode_normalized == "auto" and not stdout_isatty
     pipe_mode = mode_normalized == "pipe" or auto_pipe
     auto_plain = False
@@ -399,8 +445,8 @@ def detect_terminal_capabilities(
             theme=_resolve_theme(theme_preference),
         )
 
-    term = os.environ.get("TERM", "").lower()
-    preference = (color_preference or os.environ.get("NOLOSSIA_COLOR", "auto")).lower()
+    term = env_get("TERM", "").lower()
+    preference = (color_preference or env_get("NOLOSSIA_COLOR", "auto")).lower()
     if preference not in {"auto", "always", "never"}:
         preference = "auto"
 
@@ -468,15 +514,111 @@ def _resolve_theme(theme_preference: str | None) -> str:
     return "light"
 
 
-def _resolve_palette(theme: str) -> dict[str, str]:
+@lru_cache(maxsize=64)
+def _frame_borders(title: str, width: int, unicode: bool) -> tuple[str, str, str, int]:
+    """
+    Return (top, bottom, vertical edge, content width) for a framed block.
+    """
+    horiz = "─" if unicode else "-"
+    vert = "│" if unicode else "|"
+    tl, tr, bl, br = ("┌", "┐", "└", "┘") if unicode else ("+", "+", "+", "+")
+    title_text = f"{horiz} {title} "
+    top = f"{tl}{title_text}{horiz * max(0, width - 2 - len(title_text))}{tr}"
+    bottom = f"{bl}{horiz * (width - 2)}{br}"
+    return top, bottom, vert, width - 4
+
+
+@lru_cache(maxsize=32)
+def _text_wrapper(width: int) -> textwrap.TextWrapper:
+    # textwrap.wrap builds a new TextWrapper per call; wrap() keeps no state, so reuse one.
+    # Imported here: only text the greedy _wrap cannot handle ever needs it.
+    import textwrap
+
+    return textwrap.TextWrapper(width=width)
+
+
+def _wrap(text: str, width: int) -> list[str]:
+    """
+    Greedy word wrap matching textwrap.wrap for plain single-spaced text.
+
+    Anything textwrap treats specially (hyphens, tabs or other whitespace, runs of
+    spaces, edge spaces, words longer than width) is delegated to textwrap.
+    """
+    if not text:
+        return []
+    if "-" in text or "  " in text or not text.isprintable() or text[0] == " " or text[-1] == " ":
+        return _text_wrapper(width).wrap(text)
+    words = text.split(" ")
+    if max(map(len, words)) > width:
+        return _text_wrapper(width).wrap(text)
+    lines: list[str] = []
+    current = words[0]
+    for word in words[1:]:
+        if len(current) + 1 + len(word) <= width:
+            current = f"{current} {word}"
+        else:
+            lines.append(current)
+            current = word
+    lines.append(current)
+    return lines
+
+
+def _label_colors(palette: Mapping[str, str]) -> dict[str, str]:
+    """
+    Map label() levels to palette colors.
+    """
+    return {
+        "info": palette["primary"],
+        "accent": palette["accent"],
+        "success": palette["ok"],
+        "warn": palette["warn"],
+        "error": palette["error"],
+        "muted": palette["muted"],
+    }
+
+
+def _line_styles(palette: Mapping[str, str], use_color: bool) -> dict[str, tuple[str, str]]:
+    """
+    Precompute the (prefix, suffix) pair _style would apply for each line level.
+    """
+    levels = {
+        "info": ("primary", False),
+        "success": ("ok", True),
+        "warning": ("warn", True),
+        "error": ("error", True),
+        "muted": ("muted", False),
+    }
+    if not use_color:
+        return {level: ("", "") for level in levels}
+    return {
+        level: (f"{BOLD if bold else ''}{palette[key]}", COLOR_RESET)
+        for level, (key, bold) in levels.items()
+    }
+
+
+@lru_cache(maxsize=1024)
+def _styled_visible_length(text: str) -> int:
+    # Styled labels and links repeat across a report; strip each distinct one once.
+    return len(_CONTROL_SUB("", text))
+
+
+@lru_cache(maxsize=8)
+def _resolve_palette(theme: str) -> Mapping[str, str]:
+    # Shared across formatters, so hand out a read-only view.
     palette = THEME_PALETTES.get(theme, THEME_PALETTES["light"])
-    return {key: color_256(code) for key, code in palette.items()}
+    return MappingProxyType({key: color_256(code) for key, code in palette.items()})
 
 
 def _supports_unicode() -> bool:
     encoding = getattr(sys.stdout, "encoding", None)
     if not encoding:
         return False
+    return _encoding_supports_unicode(encoding)
+
+
+@lru_cache(maxsize=8)
+def _encoding_supports_unicode(encoding: str) -> bool:
+    # Keyed on the encoding name so a swapped sys.stdout is re-checked.
     try:
         "┌".encode(encoding)
         return True
@@ -4,10 +4,13 @@ Purpose: Duplicate grouping and master selection.
 """
 
 import os
-from typing import Any, Callable, Dict, Iterable, List
+from collections import defaultdict
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Tuple
 
 from .exceptions import DuplicateDetectionError
-from .hashing import phash_distance
+from .hashing import phash_distance, phash_distance_int
 from .models.cluster import DuplicateCluster
 from .models.fileinfo import FileInfo
 from .utils import log_error
@@ -28,6 +31,10 @@ SENSITIVITY_THRESHOLDS = {
     "aggressive": (4, 10),
 }
 
+# pHash index layout: 64-bit hashes split into four 16-bit bands for candidate lookup.
+PHASH_BAND_COUNT = 4
+PHASH_BAND_BITS = 16
+
 
 def _normalize_sensitivity(value: str | None) -> str:
     if not value:
@@ -38,36 +45,79 @@ def _normalize_sensitivity(value: str | None) -> str:
     return "conservative"
 
 
+@lru_cache(maxsize=None)
+def _band_probe_masks(radius: int) -> Tuple[int, ...]:
+    """
+    Return XOR masks with at most `radius` bits set inside one band.
+    """
+    masks = [0]
+    for bit_count in range(1, radius + 1):
+        for bits in combinations(range(PHASH_BAND_BITS), bit_count):
+            masks.append(sum(1 << bit for bit in bits))
+    return tuple(masks)
+
+
+def _phash_candidate_pairs(hashes: List[int], max_distance: int) -> List[Tuple[int, int]]:
+    """
+    Return index pairs (i < j) of hashes that may lie within max_distance bits.
+
+    Two hashes within max_distance bits differ in at most max_distance // 4 bits in at
+    least one of the four bands (pigeonhole), so probing every band within that radius
+    finds all such pairs without comparing every hash against every other.
+    """
+    masks = _band_probe_masks(max_distance // PHASH_BAND_COUNT)
+    band_mask = (1 << PHASH_BAND_BITS) - 1
+    shifts = [band * PHASH_BAND_BITS for band in range(PHASH_BAND_COUNT)]
+    indexes: List[Dict[int, List[int]]] = [defaultdict(list) for _ in shifts]
+    for position, value in enumerate(hashes):
+        for index, shift in zip(indexes, shifts):
+            index[(value >> shift) & band_mask].append(position)
+
+    pairs: set[Tuple[int, int]] = set()
+    for position, value in enumerate(hashes):
+        for index, shift in zip(indexes, shifts):
+            key = (value >> shift) & band_mask
+            for mask in masks:
+                for other in index.get(key ^ mask, ()):
+                    if other > position:
+                        pairs.add((position, other))
+    return sorted(pairs)
+
+
 class UnionFind:
     """
     A Union-Find data structure for grouping connected components.
-    Each element is a hashable FileInfo object.
+    Elements are the integers 0..n-1 (positions in the file list).
     """
-    def __init__(self, elements: Iterable[FileInfo]):
-        self.parent: Dict[FileInfo, FileInfo] = {el: el for el in elements}
-        self.rank: Dict[FileInfo, int] = {el: 0 for el in elements}
+    def __init__(self, size: int):
+        self.parent: List[int] = list(range(size))
+        self.rank = bytearray(size)  # Union by rank keeps ranks below log2(size)
 
-    def find(self, element: FileInfo) -> FileInfo:
+    def find(self, element: int) -> int:
         """Finds the representative (root) of the set containing element."""
-        if self.parent[element] == element:
-            return element
-        self.parent[element] = self.find(self.parent[element]) # Path compression
-        return self.parent[element]
-
-    def union(self, element1: FileInfo, element2: FileInfo) -> None:
+        parent = self.parent
+        # Iterative path halving: point each visited node at its grandparent.
+        while (up := parent[element]) != element:
+            grandparent = parent[up]
+            parent[element] = grandparent
+            element = grandparent
+        return element
+
+    def union(self, element1: int, element2: int) -> None:
         """Merges the sets containing element1 and element2."""
         root1 = self.find(element1)
         root2 = self.find(element2)
 
         if root1 != root2:
             # Union by rank (or size)
-            if self.rank[root1] < self.rank[root2]:
+            rank = self.rank
+            if rank[root1] < rank[root2]:
                 self.parent[root1] = root2
-            elif self.rank[root1] > self.rank[root2]:
+            elif rank[root1] > rank[root2]:
                 self.parent[root2] = root1
             else:
                 self.parent[root2] = root1
-                self.rank[root1] += 1
+                rank[root1] += 1
 
 
 def group_duplicates(
@@ -96,14 +146,14 @@ def group_duplicates(
         if not files:
             return []
 
-        # Initialize Union-Find structure with all files
-        uf = UnionFind(files)
+        # Initialize Union-Find over file positions; FileInfo objects are looked up by index.
+        uf = UnionFind(len(files))
 
         # Phase 1: Group exact duplicates using SHA256
-        exact_groups: Dict[str, List[FileInfo]] = {}
-        for file in files:
+        exact_groups: Dict[str, List[int]] = {}
+        for position, file in enumerate(files):
             if file.sha256:
-                exact_groups.setdefault(file.sha256, []).append(file)
+                exact_groups.setdefault(file.sha256, []).append(position)
         
         for group in exact_groups.values():
             if len(group) > 1:
@@ -111,34 +161,70 @@ def group_duplicates(
                 for i in range(1, len(group)):
                     uf.union(first_file, group[i])
         
-        # Phase 2: Group near-duplicates using phash and a windowed comparison
-        phash_candidates = [f for f in files if f.phash] # Only consider files with phash
-        # Sort candidates by phash to bring similar hashes closer
-        phash_candidates.sort(key=lambda x: x.phash if x.phash else "") # Sorting by string is okay for proximity
-        
-        PHASH_SEARCH_WINDOW = 20 # Compare with files within this window after sorting by phash
-
+        # Phase 2: Group near-duplicates via a banded pHash index (see _phash_candidate_pairs)
         sensitivity = _normalize_sensitivity(sensitivity)
-        for i, base in enumerate(phash_candidates):
-            for j in range(i + 1, min(i + 1 + PHASH_SEARCH_WINDOW, len(phash_candidates))):
-                candidate = phash_candidates[j]
-                diag_callback: DiagnosticsReporter | None = None
-                if diagnostics_logger is not None:
-                    def diag_callback(payload: dict[str, Any], *, _logger=diagnostics_logger) -> None:
-                        _logger(payload)
-                if are_near_duplicates(
-                    base,
-                    candidate,
-                    diagnostics_logger=diag_callback,
-                    sensitivity=sensitivity,
-                ):
-                    uf.union(base, candidate)
+        strong_threshold, weak_threshold = SENSITIVITY_THRESHOLDS[sensitivity]
+
+        def check(a: int, b: int) -> None:
+            if are_near_duplicates(
+                files[a],
+                files[b],
+                diagnostics_logger=diagnostics_logger,
+                sensitivity=sensitivity,
+            ):
+                uf.union(a, b)
+
+        phash_groups: Dict[int, List[int]] = {}
+        unparsed: List[int] = []
+        for position, file in enumerate(files):
+            if not file.phash:
+                continue
+            try:
+                value = file.phash_int if file.phash_int is not None else int(file.phash, 16)
+            except ValueError:
+                unparsed.append(position)
+            else:
+                phash_groups.setdefault(value, []).append(position)
+
+        # Hash-only decisions skip are_near_duplicates unless diagnostics need the payload.
+        def accept_by_hash(a: int, b: int) -> None:
+            if diagnostics_logger is None:
+                uf.union(a, b)
+            else:
+                check(a, b)
+
+        # Identical hashes are always in the strong band, so each group is one component.
+        for members in phash_groups.values():
+            for other in members[1:]:
+                accept_by_hash(members[0], other)
+
+        values = list(phash_groups)
+        for i, j in _phash_candidate_pairs(values, weak_threshold):
+            distance = (values[i] ^ values[j]).bit_count()
+            left = phash_groups[values[i]]
+            right = phash_groups[values[j]]
+            if distance <= strong_threshold:
+                accept_by_hash(left[0], right[0])
+            elif distance <= weak_threshold:
+                # Weak-band matches depend on per-file metadata, so check every pairing.
+                for a in left:
+                    for b in right:
+                        check(a, b)
+            elif diagnostics_logger is not None:
+                check(left[0], right[0])
+
+        # Non-hex hashes cannot be banded; compare them directly against every candidate.
+        seen_unparsed: set[int] = set()
+        for a in unparsed:
+            seen_unparsed.add(a)
+            for b, other in enumerate(files):
+                if other.phash and b not in seen_unparsed:
+                    check(a, b)
 
         # Extract clusters from the Union-Find structure
-        raw_clusters: Dict[FileInfo, List[FileInfo]] = {} # Key is representative FileInfo
-        for file in files:
-            root_file = uf.find(file)
-            raw_clusters.setdefault(root_file, []).append(file)
+        raw_clusters: Dict[int, List[FileInfo]] = {} # Key is the root position
+        for position, file in enumerate(files):
+            raw_clusters.setdefault(uf.find(position), []).append(file)
 
         final_clusters: List[DuplicateCluster] = []
         cluster_index = 1
@@ -152,7 +238,12 @@ def group_duplicates(
                 reporter=reporter,
             )
             redundant = [f for f in cluster_files if f is not master]
-            final_clusters.append(DuplicateCluster(cluster_id, cluster_files, master, redundant))
+            first_sha = cluster_files[0].sha256
+            is_exact = first_sha is not None and all(f.sha256 == first_sha for f in cluster_files)
+            redundant_size = sum(f.size for f in redundant)
+            final_clusters.append(
+                DuplicateCluster(cluster_id, cluster_files, master, redundant, is_exact, redundant_size)
+            )
 
         return final_clusters
     except Exception as exc:
@@ -355,7 +446,11 @@ def are_near_duplicates(
         emit("REJECT", "phash_missing", distance=None)
         return False
 
-    distance_value = phash_distance(a.phash, b.phash)
+    if a.phash_int is not None and b.phash_int is not None:
+        distance_value = phash_distance_int(a.phash_int, b.phash_int)
+    else:
+        # Hashes supplied without phash_int (or non-hex) fall back to string parsing.
+        distance_value = phash_distance(a.phash, b.phash)
 
     # Case 1: strong signal (lenient validation)
     if distance_value <= strong_threshold:
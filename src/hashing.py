@@ -1,15 +1,57 @@
 """Hashing helpers for duplicate detection."""
 
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 import hashlib
+import math
 import os
-from typing import List, Optional
+import sqlite3
+import statistics
+import time
+from operator import mul
+from typing import Dict, List, Optional, Tuple
 
 from PIL import Image
 
 from .exceptions import HashingError, OversizedImageError
 from .models.fileinfo import FileInfo
-from .utils import ensure_heif_registered, enforce_pixel_limit, executor_mode, log_error, log_warning
+from .utils import (
+    current_pixel_limit,
+    enforce_pixel_limit,
+    ensure_heif_registered,
+    executor_mode,
+    io_workers,
+    log_error,
+    log_warning,
+)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+HASH_CACHE_ENV = "NOLOSSIA_HASH_CACHE"
+HASH_CACHE_FILE_NAME = "hash_cache.db"
+# Bump whenever compute_sha256/compute_phash output changes so stale rows are ignored.
+HASH_CACHE_VERSION = 3
+_HASH_CACHE_BATCH = 500
+_HASH_CACHE_SCHEMA = 4  # Table layout, tracked in PRAGMA user_version
+_HASH_CACHE_MAX_AGE = 180 * 24 * 60 * 60  # Seconds a row may go unseen by any scan before it is pruned
+_file_digest = getattr(hashlib, "file_digest", None)
+_PHASH_SIZE = 32  # DCT input edge
+_PHASH_LOW = 8  # Low-frequency block edge; the 63 AC terms of the 8x8 block give the hash bits
+
+
+def _dct_basis(size: int, count: int) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Return the first `count` orthonormal DCT-II basis rows for `size` samples.
+    """
+    basis = []
+    for frequency in range(count):
+        scale = math.sqrt((1 if frequency == 0 else 2) / size)
+        basis.append(
+            tuple(scale * math.cos(math.pi * (2 * x + 1) * frequency / (2 * size)) for x in range(size))
+        )
+    return tuple(basis)
+
+
+_DCT_BASIS = _dct_basis(_PHASH_SIZE, _PHASH_LOW)
 
 
 def compute_sha256(path: str) -> str:
@@ -27,16 +69,38 @@ def compute_sha256(path: str) -> str:
     """
     try:
         normalized = os.path.abspath(path)
-        sha = hashlib.sha256()
-        with open(normalized, "rb") as handle:
-            for chunk in iter(lambda: handle.read(65536), b""):
-                sha.update(chunk)
+        with open(normalized, "rb", buffering=0) as handle:
+            if _file_digest is not None:
+                # Python 3.11+: the read/update loop runs in C.
+                return _file_digest(handle, "sha256").hexdigest()
+            sha = hashlib.sha256()
+            # Reuse one buffer; hashlib releases the GIL for large updates so threads overlap I/O.
+            buffer = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read = handle.readinto(buffer)
+                if not read:
+                    break
+                sha.update(view[:read])
         return sha.hexdigest()
     except Exception as exc:
         log_error(f"Failed to compute SHA256 for {path}: {exc}")
         raise HashingError(f"Failed to compute SHA256 for {path}") from exc
 
 
+def _dct_low_frequencies(pixels: bytes) -> List[float]:
+    """
+    Separable 2-D DCT of a square grayscale thumbnail, keeping only the low-frequency block.
+
+    Returns the _PHASH_LOW x _PHASH_LOW coefficients in row-major order, DC first.
+    """
+    size = _PHASH_SIZE
+    rows = [pixels[start:start + size] for start in range(0, size * size, size)]
+    row_coefficients = [[sum(map(mul, basis, row)) for basis in _DCT_BASIS] for row in rows]
+    columns = list(zip(*row_coefficients))
+    return [sum(map(mul, basis, column)) for basis in _DCT_BASIS for column in columns]
+
+
 def compute_phash(path: str) -> str:
     """
     Compute perceptual hash for near-duplicate detection.
@@ -55,11 +119,13 @@ def compute_phash(path: str) -> str:
         ensure_heif_registered()
         enforce_pixel_limit()
         with Image.open(normalized) as img:
-            # Simple average hash (aHash) implementation
-            resized = img.convert("L").resize((8, 8), Image.Resampling.LANCZOS)
-            pixels = list(resized.getdata())
-            avg = sum(pixels) / len(pixels)
-            bits = "".join("1" if px > avg else "0" for px in pixels)
+            # DCT pHash: low-frequency 8x8 DCT block of a 32x32 thumbnail vs. its AC median
+            resized = img.convert("L").resize((_PHASH_SIZE, _PHASH_SIZE), Image.Resampling.LANCZOS)
+            coefficients = _dct_low_frequencies(resized.tobytes())
+            ac_terms = coefficients[1:]  # DC (overall brightness) carries no structure
+            median = statistics.median(ac_terms)
+            # 63 AC bits; the top bit stays a constant 0 so the hash keeps 16 hex digits.
+            bits = "".join("1" if value > median else "0" for value in ac_terms)
             hash_int = int(bits, 2)
             return f"{hash_int:016x}"
     except Image.DecompressionBombError as exc:
@@ -86,45 +152,184 @@ def phash_distance(a: str, b: str) -> int:
         return sum(ch1 != ch2 for ch1, ch2 in zip(a, b))
 
 
-def _hash_file(fileinfo: FileInfo) -> Optional[FileInfo]:
+def phash_distance_int(a: int, b: int) -> int:
+    """
+    Compute the Hamming distance between two pHash values already parsed to int.
+    """
+    return (a ^ b).bit_count()
+
+
+def _phash_to_int(phash: Optional[str]) -> Optional[int]:
+    if not phash:
+        return None
+    try:
+        return int(phash, 16)
+    except ValueError:
+        return None
+
+
+def _hash_path(path: str) -> Optional[Tuple[str, Optional[str]]]:
     """
-    Helper function to compute SHA256 and phash for a single file.
-    Designed to be used with a process pool.
+    Helper function to compute (sha256, phash) for a single file path.
+    Designed to be used with a process pool; only the path and two hex strings cross IPC.
     """
     try:
-        sha256 = compute_sha256(fileinfo.path)
+        sha256 = compute_sha256(path)
         phash = None
         try:
-            phash = compute_phash(fileinfo.path)
+            phash = compute_phash(path)
         except OversizedImageError as exc:
             log_warning(
-                f"Skipped perceptual hash for '{fileinfo.path}' ({exc}). Keeping SHA256 only."
+                f"Skipped perceptual hash for '{path}' ({exc}). Keeping SHA256 only."
             )
         except HashingError as exc:
-            log_error(f"Perceptual hash unavailable for {fileinfo.path}: {exc}")
-        
-        return FileInfo(
-            path=fileinfo.path,
-            size=fileinfo.size,
-            format=fileinfo.format,
-            resolution=fileinfo.resolution,
-            exif_datetime=fileinfo.exif_datetime,
-            exif_gps=fileinfo.exif_gps,
-            exif_camera=fileinfo.exif_camera,
-            exif_orientation=fileinfo.exif_orientation,
-            sha256=sha256,
-            phash=phash,
-            is_raw=fileinfo.is_raw,
-            timestamp_reliable=fileinfo.timestamp_reliable,
-        )
+            log_error(f"Perceptual hash unavailable for {path}: {exc}")
+        return sha256, phash
     except HashingError as exc:
-        log_error(f"Skipping file during hashing: {fileinfo.path} ({exc})")
+        log_error(f"Skipping file during hashing: {path} ({exc})")
+        return None
+
+
+def _hash_cache_enabled() -> bool:
+    value = os.getenv(HASH_CACHE_ENV, "on").strip().lower()
+    return value not in {"0", "off", "false", "no"}
+
+
+def _open_hash_cache() -> sqlite3.Connection | None:
+    """
+    Open (or create) the on-disk hash cache in the artifacts directory.
+    Returns None when the cache is disabled or unavailable.
+    """
+    if not _hash_cache_enabled():
         return None
+    from . import reporting  # Local import to avoid circular dependency rules
+
+    path = reporting.artifact_path(HASH_CACHE_FILE_NAME)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != _HASH_CACHE_SCHEMA:
+            # Older layouts lack newer columns; the rows are only a cache, so start over.
+            connection.execute("DROP TABLE IF EXISTS hashes")
+            connection.execute(f"PRAGMA user_version = {_HASH_CACHE_SCHEMA}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "version INTEGER NOT NULL, pixel_limit INTEGER NOT NULL, last_seen INTEGER NOT NULL, "
+            "sha256 TEXT NOT NULL, phash TEXT)"
+        )
+        return connection
+    except (OSError, sqlite3.Error) as exc:
+        log_warning(f"Hash cache unavailable ({exc}); hashing all files.")
+        return None
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached_hashes(
+    connection: sqlite3.Connection,
+    paths: List[str],
+    pixel_limit: int,
+) -> Dict[str, Tuple[int, int, str, Optional[str]]]:
+    """
+    Return cached (mtime_ns, size, sha256, phash) rows for paths.
+    Rows with a phash hashed under a higher pixel limit than the current one are skipped
+    so the decompression guard is re-applied to images that may now be oversized; rows
+    without a phash are skipped when the limit has since been raised, so it is retried.
+    """
+    rows: Dict[str, Tuple[int, int, str, Optional[str]]] = {}
+    for start in range(0, len(paths), _HASH_CACHE_BATCH):
+        batch = paths[start:start + _HASH_CACHE_BATCH]
+        placeholders = ",".join("?" * len(batch))
+        query = (
+            "SELECT path, mtime_ns, size, sha256, phash FROM hashes "
+            "WHERE version = ? AND CASE WHEN phash IS NULL THEN pixel_limit >= ? ELSE pixel_limit <= ? END "
+            f"AND path IN ({placeholders})"
+        )
+        params = (HASH_CACHE_VERSION, pixel_limit, pixel_limit, *batch)
+        for path, mtime_ns, size, sha256, phash in connection.execute(query, params):
+            rows[path] = (mtime_ns, size, sha256, phash)
+    return rows
+
+
+def _store_cached_hashes(
+    connection: sqlite3.Connection,
+    rows: List[Tuple[str, int, int, int, int, int, str, Optional[str]]],
+    reused: List[str],
+    now: int,
+) -> None:
+    """
+    Insert freshly hashed rows and mark reused rows as seen by this scan.
+    """
+    with connection:
+        for start in range(0, len(rows), _HASH_CACHE_BATCH):
+            connection.executemany(
+                "INSERT OR REPLACE INTO hashes "
+                "(path, mtime_ns, size, version, pixel_limit, last_seen, sha256, phash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows[start:start + _HASH_CACHE_BATCH],
+            )
+        connection.executemany(
+            "UPDATE hashes SET last_seen = ? WHERE path = ?",
+            ((now, path) for path in reused),
+        )
+
+
+def _prune_hash_cache(connection: sqlite3.Connection, now: int) -> None:
+    """
+    Delete rows from older hash versions and rows no scan has touched within
+    _HASH_CACHE_MAX_AGE. Nothing is statted, so libraries on unmounted drives keep their rows.
+    """
+    with connection:
+        connection.execute(
+            "DELETE FROM hashes WHERE version != ? OR last_seen < ?",
+            (HASH_CACHE_VERSION, now - _HASH_CACHE_MAX_AGE),
+        )
+
+
+def _hash_process_chunksize(count: int, workers: int) -> int:
+    # Batch several files per IPC round-trip while leaving ~4 chunks per worker for balancing.
+    return max(1, count // (workers * 4))
+
+
+def _hash_files(fileinfo_list: List[FileInfo]) -> List[Optional[FileInfo]]:
+    if not fileinfo_list:
+        return []
+    paths = [fileinfo.path for fileinfo in fileinfo_list]
+    hashes: Optional[List[Optional[Tuple[str, Optional[str]]]]] = None
+    mode = executor_mode()
+    if mode == "process":
+        try:
+            workers = os.cpu_count() or 1
+            chunksize = _hash_process_chunksize(len(paths), workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                hashes = list(executor.map(_hash_path, paths, chunksize=chunksize))
+        except (NotImplementedError, PermissionError, OSError, RuntimeError) as exc:
+            log_warning(f"ProcessPool unavailable, falling back to ThreadPool for hashing: {exc}")
+    if hashes is None:
+        # Hashing is mostly file I/O once the GIL is released, so oversubscribe the CPUs.
+        with ThreadPoolExecutor(max_workers=io_workers(2)) as executor:
+            hashes = list(executor.map(_hash_path, paths))
+    return [
+        None
+        if result is None
+        else replace(fileinfo, sha256=result[0], phash=result[1], phash_int=_phash_to_int(result[1]))
+        for fileinfo, result in zip(fileinfo_list, hashes)
+    ]
 
 
 def add_hashes(fileinfo_list: List[FileInfo]) -> List[FileInfo]:
     """
     Add sha256 and phash to FileInfo objects in parallel.
+    Files whose (path, mtime, size) match the on-disk hash cache reuse the stored hashes.
 
     Args:
         fileinfo_list: FileInfo instances to hash.
@@ -132,21 +337,51 @@ def add_hashes(fileinfo_list: List[FileInfo]) -> List[FileInfo]:
     Returns:
         New list with hash values populated.
     """
-    hashed_list: List[FileInfo] = []
-    results = []
-    mode = executor_mode()
-    if mode == "process":
+    connection = _open_hash_cache() if fileinfo_list else None
+    pixel_limit = current_pixel_limit()
+    now = int(time.time())
+    signatures: List[Optional[Tuple[int, int]]] = [None] * len(fileinfo_list)
+    results: List[Optional[FileInfo]] = [None] * len(fileinfo_list)
+    pending: List[int] = list(range(len(fileinfo_list)))
+    reused: List[str] = []
+    if connection is not None:
         try:
-            with ProcessPoolExecutor() as executor:
-                results = list(executor.map(_hash_file, fileinfo_list))
-        except (NotImplementedError, PermissionError, OSError, RuntimeError) as exc:
-            log_warning(f"ProcessPool unavailable, falling back to ThreadPool for hashing: {exc}")
-            with ThreadPoolExecutor() as executor:
-                results = list(executor.map(_hash_file, fileinfo_list))
-    else:
-        with ThreadPoolExecutor() as executor:
-            results = list(executor.map(_hash_file, fileinfo_list))
+            cached = _load_cached_hashes(connection, [f.path for f in fileinfo_list], pixel_limit)
+        except sqlite3.Error as exc:
+            log_warning(f"Hash cache lookup failed ({exc}); hashing all files.")
+            cached = {}
+        pending = []
+        for index, fileinfo in enumerate(fileinfo_list):
+            signature = _file_signature(fileinfo.path)
+            signatures[index] = signature
+            row = cached.get(fileinfo.path)
+            if signature is not None and row is not None and row[:2] == signature:
+                results[index] = replace(
+                    fileinfo, sha256=row[2], phash=row[3], phash_int=_phash_to_int(row[3])
+                )
+                reused.append(fileinfo.path)
+            else:
+                pending.append(index)
+
+    hashed = _hash_files([fileinfo_list[index] for index in pending])
+    fresh_rows: List[Tuple[str, int, int, int, int, int, str, Optional[str]]] = []
+    for index, result in zip(pending, hashed):
+        results[index] = result
+        signature = signatures[index]
+        # SHA256-only results (RAW formats, pixel-guard skips) are cached too; the stored
+        # pixel limit decides when their phash is worth retrying.
+        if result is not None and signature is not None:
+            fresh_rows.append(
+                (result.path, *signature, HASH_CACHE_VERSION, pixel_limit, now, result.sha256, result.phash)
+            )
 
-    hashed_list = [result for result in results if result is not None]
+    if connection is not None:
+        try:
+            _store_cached_hashes(connection, fresh_rows, reused, now)
+            _prune_hash_cache(connection, now)
+        except sqlite3.Error as exc:
+            log_warning(f"Hash cache update failed ({exc}); results were not cached.")
+        finally:
+            connection.close()
 
-    return hashed_list
+    return [result for result in results if result is not None]
@@ -73,6 +73,7 @@ def build_merge_plan(
         actions = folder_actions + file_actions
 
         required_space, destination_free = _calculate_storage(actions, destination)
+        master_actions, review_actions, exact_actions, near_actions = _partition_file_actions(file_actions)
 
         if required_space > destination_free:
             log_error("Insufficient storage for merge operation")
@@ -90,6 +91,11 @@ def build_merge_plan(
             actions=actions,
             destination_path=destination,
             skipped_files=skipped_files,
+            missing_exif_count=sum(1 for f in files if f.exif_datetime is None),
+            master_actions=master_actions,
+            review_actions=review_actions,
+            exact_quarantine_actions=exact_actions,
+            near_duplicate_actions=near_actions,
         )
     except StorageError:
         raise
@@ -175,6 +181,30 @@ def _create_file_actions(
     return actions, folders
 
 
+def _partition_file_actions(
+    actions: List[MergeAction],
+) -> Tuple[
+    List[MoveMasterAction],
+    List[MoveMasterAction],
+    List[MoveToQuarantineExactAction],
+    List[MarkNearDuplicateAction],
+]:
+    """Splits file actions into (masters, REVIEW masters, exact quarantine, near marks)."""
+    masters: List[MoveMasterAction] = []
+    review: List[MoveMasterAction] = []
+    exact: List[MoveToQuarantineExactAction] = []
+    near: List[MarkNearDuplicateAction] = []
+    for action in actions:
+        if isinstance(action, MoveMasterAction):
+            # determine_target_path sets review_reason exactly when it routes to REVIEW/.
+            (review if action.review_reason else masters).append(action)
+        elif isinstance(action, MoveToQuarantineExactAction):
+            exact.append(action)
+        elif isinstance(action, MarkNearDuplicateAction):
+            near.append(action)
+    return masters, review, exact, near
+
+
 def _create_folder_actions(folders: Set[str]) -> List[CreateFolderAction]:
     """Creates folder creation actions."""
     return [CreateFolderAction(path=os.path.abspath(folder)) for folder in folders]
@@ -20,7 +20,7 @@ class CreateFolderAction(MergeAction):
 class MoveMasterAction(MergeAction):
     """Action to move a master file."""
     src: str
-    dst: str
+    dst: str  # Always absolute and normalized (build_merge_plan / safe_move); summaries rely on it
     sha256: str | None
     size: int
     review_reason: str | None = None
@@ -19,3 +19,5 @@ class DuplicateCluster:
     files: List[FileInfo]
     master: Optional[FileInfo]
     redundant: List[FileInfo]
+    is_exact: Optional[bool] = None  # Set by group_duplicates; None means not yet computed
+    redundant_size: Optional[int] = None  # Total bytes in `redundant`; set alongside is_exact
@@ -28,6 +28,8 @@ class FileInfo:
     timestamp_reliable: bool = True
     review_reason: Optional[str] = None
     selection_reason: Optional[str] = None
+    # phash parsed once at hashing time; None when phash is missing or not hex.
+    phash_int: Optional[int] = None
 
     def __hash__(self):
         return hash(self.path)
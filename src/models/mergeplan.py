@@ -3,9 +3,14 @@ Module: mergeplan
 Purpose: Merge plan dataclass definition.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
-from .actions import MergeAction
+from .actions import (
+    MarkNearDuplicateAction,
+    MergeAction,
+    MoveMasterAction,
+    MoveToQuarantineExactAction,
+)
 
 
 @dataclass
@@ -22,3 +27,10 @@ class MergePlan:
     actions: List[MergeAction]
     destination_path: str
     skipped_files: int = 0
+    missing_exif_count: int = 0
+    # File actions by kind, split once when the plan is built. They share objects with
+    # ``actions``, which stays the single ordered list used for execution and reports.
+    master_actions: List[MoveMasterAction] = field(default_factory=list)
+    review_actions: List[MoveMasterAction] = field(default_factory=list)
+    exact_quarantine_actions: List[MoveToQuarantineExactAction] = field(default_factory=list)
+    near_duplicate_actions: List[MarkNearDuplicateAction] = field(default_factory=list)
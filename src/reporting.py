@@ -10,6 +10,7 @@ import json
 import os
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, List
 from urllib.parse import quote
 
@@ -32,8 +33,14 @@ NEAR_DUP_CLUSTER_LIMIT = 25
 NEAR_DUP_CANDIDATE_LIMIT = 12
 
 
+@lru_cache(maxsize=128)
+def _resolve_artifact_path(cwd: str, artifacts_dir: str, filename: str) -> str:
+    return os.path.normpath(os.path.join(cwd, artifacts_dir, filename))
+
+
 def artifact_path(filename: str) -> str:
-    return os.path.abspath(os.path.join(ARTIFACTS_DIR, filename))
+    # Keyed on cwd and ARTIFACTS_DIR so a chdir or override never returns a stale path.
+    return _resolve_artifact_path(os.getcwd(), ARTIFACTS_DIR, filename)
 
 
 def ensure_log_initialized() -> str:
@@ -5,6 +5,8 @@ Purpose: Shared constants and helpers for REVIEW bucket routing.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 REVIEW_REASON_MISSING_EXIF = "missing_exif_timestamp"
 REVIEW_REASON_UNRELIABLE_TIMESTAMP = "timestamp_unreliable"
 REVIEW_REASON_INVALID_CHRONOLOGY = "invalid_chronology"
@@ -16,6 +18,7 @@ _REASON_LABELS = {
 }
 
 
+@lru_cache(maxsize=32)
 def describe_review_reason(reason: str | None) -> str:
     """
     Return a human-readable description for a REVIEW routing reason.
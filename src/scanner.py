@@ -4,11 +4,12 @@ Purpose: Directory scanning utilities.
 """
 
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from .exceptions import ScanError
 from .models.fileinfo import FileInfo
-from .utils import log_error, log_warning
+from .utils import io_workers, log_error, log_warning
 
 SUPPORTED_FORMATS = {
     "jpeg",
@@ -24,6 +25,27 @@ SUPPORTED_FORMATS = {
     "rw2",
 }
 RAW_FORMATS = {"dng", "nef", "cr2", "cr3", "arw", "rw2"}
+_SUPPORTED_SUFFIXES = frozenset(f".{fmt}" for fmt in SUPPORTED_FORMATS)
+# Below this many files, statting serially is cheaper than spinning up a pool.
+PARALLEL_SIZE_THRESHOLD = 256
+
+
+def _stat_size(path: str) -> int | OSError:
+    try:
+        return os.path.getsize(path)
+    except OSError as exc:
+        return exc
+
+
+def _parallel_sizes(paths: List[str]) -> List[int | OSError]:
+    """
+    Return the size of each path, or the OSError raised while reading it.
+    Large batches are statted on a thread pool so the syscalls overlap.
+    """
+    if len(paths) < PARALLEL_SIZE_THRESHOLD:
+        return [_stat_size(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=io_workers(2, metadata_bound=True)) as executor:
+        return list(executor.map(_stat_size, paths))
 
 
 def scan_paths(paths: List[str]) -> List[FileInfo]:
@@ -67,6 +89,7 @@ def scan_paths_with_stats(paths: List[str]) -> tuple[List[FileInfo], int]:
 
     normalized_paths = [os.path.abspath(p) for p in paths]
     results: List[FileInfo] = []
+    candidates: List[Tuple[str, str]] = []
     skipped_symlinks = 0
 
     for path in normalized_paths:
@@ -98,27 +121,28 @@ def scan_paths_with_stats(paths: List[str]) -> tuple[List[FileInfo], int]:
                 ext = ext.lstrip(".").lower()
                 if ext not in SUPPORTED_FORMATS:
                     continue
-                try:
-                    size = os.path.getsize(file_path)
-                except OSError as exc:
-                    log_error(f"Failed to read file info for {file_path}: {exc}")
-                    continue
-
-                fileinfo = FileInfo(
-                    path=file_path,
-                    size=size,
-                    format=ext,
-                    resolution=None,
-                    exif_datetime=None,
-                    exif_gps=None,
-                    exif_camera=None,
-                    exif_orientation=None,
-                    sha256=None,
-                    phash=None,
-                    is_raw=ext in RAW_FORMATS,
-                    timestamp_reliable=False,
-                )
-                results.append(fileinfo)
+                candidates.append((file_path, ext))
+
+    for (file_path, ext), size in zip(candidates, _parallel_sizes([c[0] for c in candidates])):
+        if isinstance(size, OSError):
+            log_error(f"Failed to read file info for {file_path}: {size}")
+            continue
+
+        fileinfo = FileInfo(
+            path=file_path,
+            size=size,
+            format=ext,
+            resolution=None,
+            exif_datetime=None,
+            exif_gps=None,
+            exif_camera=None,
+            exif_orientation=None,
+            sha256=None,
+            phash=None,
+            is_raw=ext in RAW_FORMATS,
+            timestamp_reliable=False,
+        )
+        results.append(fileinfo)
 
     return results, skipped_symlinks
 
@@ -136,10 +160,11 @@ def filter_supported_files(files: List[str]) -> List[str]:
     Raises:
         None
     """
-    supported: List[str] = []
-    for path in files:
-        _, ext = os.path.splitext(path)
-        if ext:
-            if ext.lstrip(".").lower() in SUPPORTED_FORMATS:
-                supported.append(os.path.abspath(path))
-    return supported
+    return [os.path.abspath(path) for path in files if is_supported(path)]
+
+
+def is_supported(name: str) -> bool:
+    """
+    Return True when a file name or path has a supported image extension.
+    """
+    return os.path.splitext(name)[1].lower() in _SUPPORTED_SUFFIXES
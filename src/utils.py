@@ -5,8 +5,9 @@ Purpose: Shared helper utilities for Nolossia.
 
 import os
 import shutil
+import sys
 import urllib.parse
-from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Tuple
 
 from .exceptions import NolossiaError
@@ -24,6 +25,8 @@ _PROCESS_POOL_SUPPORTED: bool | None = None
 
 
 def _apply_pillow_limit(limit: int) -> None:
+    if "PIL.Image" not in sys.modules:
+        return  # enforce_pixel_limit() applies the limit before every Image.open
     try:
         from PIL import Image
         Image.MAX_IMAGE_PIXELS = limit
@@ -113,6 +116,8 @@ def _supports_process_pool() -> bool:
     global _PROCESS_POOL_SUPPORTED
     if _PROCESS_POOL_SUPPORTED is not None:
         return _PROCESS_POOL_SUPPORTED
+    from concurrent.futures import ProcessPoolExecutor
+
     try:
         with ProcessPoolExecutor(max_workers=1) as executor:
             future = executor.submit(_process_pool_probe)
@@ -179,6 +184,17 @@ def executor_source() -> str | None:
     return _EXECUTOR_SOURCE
 
 
+def io_workers(multiplier: int, *, metadata_bound: bool = False) -> int:
+    """
+    Thread count for I/O-bound pools: cpu_count() * multiplier, capped at 32.
+    Pools that only issue readdir/lstat (metadata_bound) are held to 2 threads on
+    macOS, where APFS serializes those calls and extra threads only contend.
+    """
+    if metadata_bound and sys.platform == "darwin":
+        return 2
+    return min(32, (os.cpu_count() or 1) * multiplier)
+
+
 COLOR_RESET = "\033[0m"
 COLOR_GREEN = "\033[32m"
 COLOR_RED = "\033[31m"
@@ -502,6 +518,7 @@ def print_nolossia_logo_simple(return_string: bool = False) -> str | None:  # pr
     return print_nolossia_logo_ascii(return_string=return_string)
 
 
+@lru_cache(maxsize=512)  # Pure int -> str; summaries format the same totals repeatedly
 def human_readable_size(bytes: int) -> str:
     """
     Convert byte size into human-readable string.
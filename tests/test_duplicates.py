@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from src.duplicates import SENSITIVITY_THRESHOLDS, _phash_candidate_pairs, group_duplicates
+from src.models.fileinfo import FileInfo
+
+
+def _near_hashes(rng: random.Random, max_distance: int) -> list[int]:
+    """Random 64-bit hashes plus neighbours at every distance up to and just past max_distance."""
+    hashes = []
+    for _ in range(40):
+        base = rng.getrandbits(64)
+        hashes.append(base)
+        for distance in range(1, max_distance + 2):
+            flips = rng.sample(range(64), distance)
+            hashes.append(base ^ sum(1 << bit for bit in flips))
+    return hashes
+
+
+@pytest.mark.parametrize("sensitivity", sorted(SENSITIVITY_THRESHOLDS))
+def test_candidate_pairs_match_brute_force(sensitivity):
+    _, weak_threshold = SENSITIVITY_THRESHOLDS[sensitivity]
+    rng = random.Random(weak_threshold)
+    hashes = _near_hashes(rng, weak_threshold)
+
+    expected = {
+        (i, j)
+        for i in range(len(hashes))
+        for j in range(i + 1, len(hashes))
+        if (hashes[i] ^ hashes[j]).bit_count() <= weak_threshold
+    }
+    candidates = set(_phash_candidate_pairs(hashes, weak_threshold))
+
+    assert expected <= candidates
+
+
+def _hashed_file(path: str, phash: int) -> FileInfo:
+    return FileInfo(
+        path=path,
+        size=1000,
+        format="jpg",
+        resolution=(640, 480),
+        exif_datetime=None,
+        exif_gps=None,
+        exif_camera=None,
+        exif_orientation=None,
+        sha256=path,
+        phash=f"{phash:016x}",
+        is_raw=False,
+        phash_int=phash,
+    )
+
+
+def test_group_duplicates_clusters_hashes_differing_in_high_band():
+    base = 0x0123_4567_89AB_CDEF
+    files = [
+        _hashed_file("/photos/a.jpg", base),
+        _hashed_file("/photos/b.jpg", base ^ (0b11 << 62)),
+    ]
+
+    clusters = group_duplicates(files)
+
+    assert len(clusters) == 1
+    assert {f.path for f in clusters[0].files} == {"/photos/a.jpg", "/photos/b.jpg"}
@@ -0,0 +1,192 @@
+import os
+import sqlite3
+
+import pytest
+from PIL import Image
+
+from src import hashing, reporting, utils
+from src.hashing import compute_phash
+from src.models.fileinfo import FileInfo
+
+_DC_BIT = 1 << 63
+
+
+def _save_gradient(path, *, horizontal: bool, offset: int = 0) -> str:
+    size = 64
+    img = Image.new("L", (size, size))
+    img.putdata(
+        [
+            min(255, offset + 3 * (x if horizontal else y))
+            for y in range(size)
+            for x in range(size)
+        ]
+    )
+    img.save(path)
+    return str(path)
+
+
+def test_phash_dc_bit_is_constant(tmp_path):
+    dark = int(compute_phash(_save_gradient(tmp_path / "dark.png", horizontal=True)), 16)
+    bright = int(compute_phash(_save_gradient(tmp_path / "bright.png", horizontal=True, offset=60)), 16)
+
+    assert dark & _DC_BIT == 0
+    assert bright & _DC_BIT == 0
+
+
+def test_phash_images_differ_only_in_ac_bits(tmp_path):
+    first = compute_phash(_save_gradient(tmp_path / "horizontal.png", horizontal=True))
+    second = compute_phash(_save_gradient(tmp_path / "vertical.png", horizontal=False))
+
+    assert len(first) == len(second) == 16
+    difference = int(first, 16) ^ int(second, 16)
+    assert difference != 0
+    assert difference & _DC_BIT == 0
+
+
+def _fileinfo(path: str) -> FileInfo:
+    return FileInfo(
+        path=path,
+        size=os.path.getsize(path),
+        format=os.path.splitext(path)[1].lstrip(".").lower(),
+        resolution=None,
+        exif_datetime=None,
+        exif_gps=None,
+        exif_camera=None,
+        exif_orientation=None,
+        sha256=None,
+        phash=None,
+        is_raw=False,
+    )
+
+
+@pytest.fixture
+def hashed_paths(tmp_path, monkeypatch):
+    """Point the hash cache at tmp_path, hash on threads, and record which paths get hashed."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(reporting, "ARTIFACTS_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.delenv(hashing.HASH_CACHE_ENV, raising=False)
+    monkeypatch.setattr(utils, "_EXECUTOR_MODE", "thread")
+    monkeypatch.setattr(utils, "_PIXEL_LIMIT", utils.DEFAULT_PIXEL_LIMIT)
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", Image.MAX_IMAGE_PIXELS)
+    calls = []
+    original = hashing._hash_path
+
+    def counting(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(hashing, "_hash_path", counting)
+    return calls
+
+
+def _cache_rows(tmp_path) -> dict:
+    with sqlite3.connect(tmp_path / "artifacts" / hashing.HASH_CACHE_FILE_NAME) as connection:
+        return {row[0]: row[1:] for row in connection.execute("SELECT path, pixel_limit, phash FROM hashes")}
+
+
+def test_hash_cache_hit_when_signature_unchanged(tmp_path, hashed_paths):
+    photo = _save_gradient(tmp_path / "a.png", horizontal=True)
+
+    first = hashing.add_hashes([_fileinfo(photo)])
+    second = hashing.add_hashes([_fileinfo(photo)])
+
+    assert hashed_paths == [photo]
+    assert (second[0].sha256, second[0].phash, second[0].phash_int) == (
+        first[0].sha256,
+        first[0].phash,
+        first[0].phash_int,
+    )
+
+
+def test_hash_cache_miss_after_mtime_or_size_change(tmp_path, hashed_paths):
+    photo = _save_gradient(tmp_path / "a.png", horizontal=True)
+    hashing.add_hashes([_fileinfo(photo)])
+
+    stat = os.stat(photo)
+    os.utime(photo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    hashing.add_hashes([_fileinfo(photo)])
+
+    stat = os.stat(photo)
+    with open(photo, "ab") as handle:
+        handle.write(b"\0")
+    os.utime(photo, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    hashing.add_hashes([_fileinfo(photo)])
+
+    assert hashed_paths == [photo, photo, photo]
+
+
+def test_hash_cache_ignores_rows_from_another_version(tmp_path, hashed_paths, monkeypatch):
+    photo = _save_gradient(tmp_path / "a.png", horizontal=True)
+    hashing.add_hashes([_fileinfo(photo)])
+
+    monkeypatch.setattr(hashing, "HASH_CACHE_VERSION", hashing.HASH_CACHE_VERSION + 1)
+    hashing.add_hashes([_fileinfo(photo)])
+    hashing.add_hashes([_fileinfo(photo)])
+
+    assert hashed_paths == [photo, photo]
+
+
+def test_hash_cache_rehashes_when_pixel_limit_is_lowered(tmp_path, hashed_paths, monkeypatch):
+    photo = _save_gradient(tmp_path / "a.png", horizontal=True)
+    monkeypatch.setattr(utils, "_PIXEL_LIMIT", utils.DEFAULT_PIXEL_LIMIT + 1)
+    hashing.add_hashes([_fileinfo(photo)])
+    monkeypatch.setattr(utils, "_PIXEL_LIMIT", utils.DEFAULT_PIXEL_LIMIT + 2)
+    hashing.add_hashes([_fileinfo(photo)])
+    assert hashed_paths == [photo]
+
+    monkeypatch.setattr(utils, "_PIXEL_LIMIT", utils.DEFAULT_PIXEL_LIMIT)
+    hashing.add_hashes([_fileinfo(photo)])
+    assert hashed_paths == [photo, photo]
+    assert _cache_rows(tmp_path)[photo][0] == utils.DEFAULT_PIXEL_LIMIT
+
+
+def test_hash_cache_keeps_sha256_only_rows_until_limit_is_raised(tmp_path, hashed_paths, monkeypatch):
+    raw = tmp_path / "photo.cr3"
+    raw.write_bytes(b"not a decodable image")
+    raw = str(raw)
+
+    first = hashing.add_hashes([_fileinfo(raw)])
+    second = hashing.add_hashes([_fileinfo(raw)])
+    assert first[0].phash is None and second[0].sha256 == first[0].sha256
+    assert hashed_paths == [raw]
+    assert _cache_rows(tmp_path)[raw] == (utils.DEFAULT_PIXEL_LIMIT, None)
+
+    monkeypatch.setattr(utils, "_PIXEL_LIMIT", utils.DEFAULT_PIXEL_LIMIT - 1)
+    hashing.add_hashes([_fileinfo(raw)])
+    assert hashed_paths == [raw]
+
+    monkeypatch.setattr(utils, "_PIXEL_LIMIT", utils.DEFAULT_PIXEL_LIMIT + 1)
+    hashing.add_hashes([_fileinfo(raw)])
+    assert hashed_paths == [raw, raw]
+
+
+def test_hash_cache_prunes_only_old_or_stale_version_rows(tmp_path, hashed_paths):
+    recent = _save_gradient(tmp_path / "recent.png", horizontal=True)
+    aged = _save_gradient(tmp_path / "aged.png", horizontal=False)
+    scanned = _save_gradient(tmp_path / "scanned.png", horizontal=True, offset=40)
+    hashing.add_hashes([_fileinfo(recent), _fileinfo(aged), _fileinfo(scanned)])
+    os.remove(recent)  # e.g. an unmounted library: not scanned, but seen recently
+
+    database = tmp_path / "artifacts" / hashing.HASH_CACHE_FILE_NAME
+    with sqlite3.connect(database) as connection:
+        connection.execute("UPDATE hashes SET last_seen = 0 WHERE path IN (?, ?)", (aged, scanned))
+        connection.execute(
+            "INSERT INTO hashes (path, mtime_ns, size, version, pixel_limit, last_seen, sha256, phash) "
+            "VALUES ('old-version', 0, 0, ?, 0, 9999999999, '', NULL)",
+            (hashing.HASH_CACHE_VERSION - 1,),
+        )
+
+    hashing.add_hashes([_fileinfo(scanned)])
+
+    assert set(_cache_rows(tmp_path)) == {recent, scanned}
+
+
+def test_hash_cache_disabled_by_env(tmp_path, hashed_paths, monkeypatch):
+    monkeypatch.setenv(hashing.HASH_CACHE_ENV, "off")
+    photo = _save_gradient(tmp_path / "a.png", horizontal=True)
+
+    hashing.add_hashes([_fileinfo(photo)])
+    hashing.add_hashes([_fileinfo(photo)])
+
+    assert hashed_paths == [photo, photo]
+    assert not (tmp_path / "artifacts" / hashing.HASH_CACHE_FILE_NAME).exists()